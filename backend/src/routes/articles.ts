@@ -0,0 +1,69 @@
+/**
+ * Article Ingestion Endpoint
+ * Receives batches pushed by the Python scrapers (gzip JSON bodies)
+ *
+ * Flow:
+ * 1. Scraper POSTs { articles: [...] } as soon as articles are extracted
+ * 2. Articles are saved before the reply: 200 once all are stored, 503 if
+ *    any could not be (the scraper spools the batch and sends it again)
+ * 3. Saved articles are clustered and analyzed in the background
+ */
+
+import { Router, Request, Response } from 'express';
+import { ArticleIngestionService } from '../services/articleIngestion';
+
+const router = Router();
+
+let ingestionService: ArticleIngestionService | null = null;
+
+/**
+ * Lazily create the service (it throws without Supabase credentials)
+ */
+function getIngestionService(): ArticleIngestionService {
+  if (!ingestionService) {
+    ingestionService = new ArticleIngestionService();
+  }
+  return ingestionService;
+}
+
+/**
+ * POST /articles/batch
+ * Body: { articles: ScrapedArticle[] }, optionally Content-Encoding: gzip
+ */
+router.post('/batch', async (req: Request, res: Response) => {
+  // Fail closed: without a configured key nobody may write batches
+  const token = process.env.SCRAPER_API_KEY;
+  if (!token) {
+    return res.status(503).json({ error: 'Batch ingestion not configured (SCRAPER_API_KEY unset)' });
+  }
+  if (req.get('Authorization') !== `Bearer ${token}`) {
+    return res.status(401).json({ error: 'Unauthorized' });
+  }
+
+  const articles = req.body?.articles;
+  if (!Array.isArray(articles)) {
+    return res.status(400).json({ error: 'Expected { articles: [...] }' });
+  }
+
+  let service: ArticleIngestionService;
+  try {
+    service = getIngestionService();
+  } catch (error) {
+    console.error('Ingestion unavailable:', error);
+    return res.status(503).json({ error: 'Ingestion unavailable' });
+  }
+
+  const { savedIds, failed } = await service.saveBatch(articles);
+
+  // Clustering and AI analysis take far longer than the request
+  service.analyzeSaved(savedIds).catch((error) => {
+    console.error('Error analyzing pushed batch:', error);
+  });
+
+  if (failed) {
+    return res.status(503).json({ error: `${failed} of ${articles.length} articles could not be saved`, saved: savedIds.length });
+  }
+  return res.status(200).json({ saved: savedIds.length, existing: articles.length - savedIds.length });
+});
+
+export default router;
@@ -16,6 +16,8 @@ const API_VERSION = process.env.API_VERSION || 'v1';
 
 // Middleware
 app.use(cors());
+// Scraper batches are larger than the default 100kb (gzip bodies are inflated by the parser)
+app.use(`/api/${API_VERSION}/articles`, express.json({ limit: '10mb' }));
 app.use(express.json());
 app.use(express.urlencoded({ extended: true }));
 
@@ -43,6 +45,7 @@ app.get(`/api/${API_VERSION}/`, (_req: Request, res: Response) => {
     endpoints: {
       health: '/health',
       whatsapp_webhook: `/api/${API_VERSION}/whatsapp/webhook`,
+      article_batch: `/api/${API_VERSION}/articles/batch`,
       stories: `/api/${API_VERSION}/stories`,
       sources: `/api/${API_VERSION}/sources`,
       trending: `/api/${API_VERSION}/stories/trending`,
@@ -53,9 +56,11 @@ app.get(`/api/${API_VERSION}/`, (_req: Request, res: Response) => {
 
 // Import routes
 import whatsappRouter from './routes/whatsapp';
+import articlesRouter from './routes/articles';
 
 // Register routes
 app.use(`/api/${API_VERSION}/whatsapp`, whatsappRouter);
+app.use(`/api/${API_VERSION}/articles`, articlesRouter);
 
 // TODO: Add more routes
 // import storiesRouter from './routes/stories';
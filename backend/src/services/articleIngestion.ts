@@ -73,108 +73,128 @@ export class ArticleIngestionService {
 
   /**
    * Save article to database
+   * Returns null if it already exists; throws if it could not be saved
    */
   private async saveArticle(
     article: ScrapedArticle,
     sourceId: string
   ): Promise<string | null> {
-    try {
-      // Check if article already exists
-      if (await this.articleExists(article.url)) {
-        console.log(`  ⊘ Article already exists: ${article.url}`);
-        return null;
-      }
-
-      const { data, error } = await this.supabase
-        .from('articles')
-        .insert({
-          source_id: sourceId,
-          title: article.title,
-          snippet: article.snippet,
-          full_text: article.full_text,
-          url: article.url,
-          image_url: article.image_url,
-          author: article.author,
-          published_at: article.published_at,
-          scraped_at: new Date().toISOString(),
-          is_breaking: false // TODO: Implement breaking news detection
-        })
-        .select('id')
-        .single();
+    // Check if article already exists
+    if (await this.articleExists(article.url)) {
+      console.log(`  ⊘ Article already exists: ${article.url}`);
+      return null;
+    }
 
-      if (error) {
-        console.error('Error saving article:', error);
-        return null;
-      }
+    const { data, error } = await this.supabase
+      .from('articles')
+      .insert({
+        source_id: sourceId,
+        title: article.title,
+        snippet: article.snippet,
+        full_text: article.full_text,
+        url: article.url,
+        image_url: article.image_url,
+        author: article.author,
+        published_at: article.published_at,
+        scraped_at: new Date().toISOString(),
+        is_breaking: false // TODO: Implement breaking news detection
+      })
+      .select('id')
+      .single();
 
-      console.log(`  ✓ Saved article: ${article.title.substring(0, 60)}...`);
-      return data.id;
-    } catch (error) {
-      console.error('Error in saveArticle:', error);
-      return null;
+    if (error) {
+      throw error;
     }
+
+    console.log(`  ✓ Saved article: ${article.title.substring(0, 60)}...`);
+    return data.id;
   }
 
   /**
-   * Process a batch of scraped articles
-   * Full pipeline: Save → Cluster → Analyze bias
+   * Save a batch of scraped articles (no clustering or analysis yet)
+   * Returns the ids of newly saved articles and how many could not be saved;
+   * a batch with failures can be sent again, saved articles are then skipped
    */
-  async processBatch(articles: ScrapedArticle[]): Promise<void> {
-    console.log(`\n${'='.repeat(60)}`);
-    console.log(`Processing ${articles.length} articles`);
-    console.log(`${'='.repeat(60)}\n`);
-
-    let savedCount = 0;
-    let clusteredCount = 0;
-    let analyzedCount = 0;
+  async saveBatch(articles: ScrapedArticle[]): Promise<{ savedIds: string[]; failed: number }> {
+    const savedIds: string[] = [];
+    let failed = 0;
 
     for (const article of articles) {
       try {
-        // 1. Get source_id
         const sourceId = await this.getSourceId(article.source_name);
         if (!sourceId) {
-          console.error(`  ✗ No source_id for "${article.source_name}"`);
-          continue;
+          throw new Error(`No source_id for "${article.source_name}"`);
         }
 
-        // 2. Save to database
         const articleId = await this.saveArticle(article, sourceId);
-        if (!articleId) {
-          continue; // Already exists or error
+        if (articleId) {
+          savedIds.push(articleId);
         }
-        savedCount++;
+      } catch (error) {
+        failed++;
+        console.error(`  ✗ Error saving article: ${article.title}`, error);
+      }
+    }
+
+    return { savedIds, failed };
+  }
+
+  /**
+   * Cluster and analyze saved articles
+   * Returns how many were clustered and analyzed
+   */
+  async analyzeSaved(articleIds: string[]): Promise<{ clustered: number; analyzed: number }> {
+    let clustered = 0;
+    let analyzed = 0;
 
-        // 3. Cluster article
+    for (const articleId of articleIds) {
+      try {
+        // 1. Cluster article
         console.log(`  📊 Clustering...`);
         const clusterId = await this.clusteringService.clusterArticle(articleId);
         if (clusterId) {
-          clusteredCount++;
+          clustered++;
 
           // Update cluster representatives (for Comparison Slider)
           await this.clusteringService.updateClusterRepresentatives(clusterId);
         }
 
-        // 4. Trigger AI bias analysis
+        // 2. Trigger AI bias analysis
         console.log(`  🤖 Analyzing bias...`);
         const biasScore = await analyzeBias(articleId);
         if (biasScore !== null) {
-          analyzedCount++;
+          analyzed++;
           console.log(`  ✓ Bias analysis complete (score: ${biasScore})`);
         }
 
         console.log(''); // Blank line between articles
 
       } catch (error) {
-        console.error(`Error processing article: ${article.title}`, error);
+        console.error(`Error processing article ${articleId}`, error);
       }
     }
 
+    return { clustered, analyzed };
+  }
+
+  /**
+   * Process a batch of scraped articles
+   * Full pipeline: Save → Cluster → Analyze bias
+   */
+  async processBatch(articles: ScrapedArticle[]): Promise<void> {
+    console.log(`\n${'='.repeat(60)}`);
+    console.log(`Processing ${articles.length} articles`);
+    console.log(`${'='.repeat(60)}\n`);
+
+    const { savedIds } = await this.saveBatch(articles);
+    const { clustered, analyzed } = await this.analyzeSaved(savedIds);
+
     console.log(`\n${'='.repeat(60)}`);
     console.log('BATCH PROCESSING COMPLETE');
     console.log(`${'='.repeat(60)}`);
-    console.log(`Saved: ${savedCount}/${articles.length}`);
-    console.log(`Clustered: ${clusteredCount}/${savedCount}`);
-    console.log(`Analyzed: ${analyzedCount}/${savedCount}`);
+    console.log(`Saved: ${savedIds.length}/${articles.length}`);
+    console.log(`Clustered: ${clustered}/${savedIds.length}`);
+    console.log(`Analyzed: ${analyzed}/${savedIds.length}`);
     console.log(`${'='.repeat(60)}\n`);
   }
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Espectro Article Store CLI
+Query and maintain the local SQLite article store (output/articles.db)
+
+Usage:
+    python articles_cli.py query --source "Folha de S.Paulo" --since 2026-01-05 --until 2026-01-06
+    python articles_cli.py query --url https://g1.globo.com/...
+    python articles_cli.py import                  # Import every output/*.json file
+    python articles_cli.py import output/g1_*.json # Import specific files
+    python articles_cli.py stats
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import OUTPUT_DIR
+from utils.article_store import ArticleStore, article_store
+
+
+def open_for_reading() -> Optional[ArticleStore]:
+    """
+    The article store opened read-only, or None (with an error printed)
+    Queries never create or migrate the database
+    """
+    store = ArticleStore(read_only=True)
+    try:
+        store.conn
+    except sqlite3.OperationalError as e:
+        print(f"✗ Cannot open {store.db_path}: {e} (run a scrape or `import` first)", file=sys.stderr)
+        return None
+    return store
+
+
+def cmd_query(args) -> int:
+    store = open_for_reading()
+    if store is None:
+        return 1
+
+    rows = store.query(
+        source_name=args.source,
+        since=datetime.fromisoformat(args.since) if args.since else None,
+        until=datetime.fromisoformat(args.until) if args.until else None,
+        url=args.url,
+        limit=args.limit
+    )
+
+    for row in rows:
+        print(json.dumps(row, ensure_ascii=False))
+
+    print(f"{len(rows)} articles", file=sys.stderr)
+    return 0
+
+
+def cmd_import(args) -> int:
+    files = args.files or sorted(OUTPUT_DIR.glob("*.json"))
+    total = 0
+
+    for path in files:
+        try:
+            count = article_store.import_json_file(Path(path))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"✗ {path}: {e}", file=sys.stderr)
+            continue
+
+        total += count
+        print(f"✓ {path}: {count} articles")
+
+    print(f"Imported {total} articles from {len(files)} files")
+    return 0
+
+
+def cmd_stats(args) -> int:
+    store = open_for_reading()
+    if store is None:
+        return 1
+
+    counts = store.counts_by_source()
+
+    for source_name, count in counts.items():
+        print(f"{source_name}: {count}")
+    print(f"Total: {sum(counts.values())}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Espectro local article store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query = subparsers.add_parser("query", help="Print matching articles as JSON lines")
+    query.add_argument("--source", help="Source name, e.g. G1")
+    query.add_argument("--since", help="Published at or after (ISO date/time, local time if no offset)")
+    query.add_argument("--until", help="Published before (ISO date/time)")
+    query.add_argument("--url", help="Exact article URL")
+    query.add_argument("--limit", type=int)
+    query.set_defaults(func=cmd_query)
+
+    importer = subparsers.add_parser("import", help="Import scraper JSON output files")
+    importer.add_argument("files", nargs="*", type=Path, help="Files to import (default: output/*.json)")
+    importer.set_defaults(func=cmd_import)
+
+    stats = subparsers.add_parser("stats", help="Article counts per source")
+    stats.set_defaults(func=cmd_stats)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Article Memory & Serialization Benchmark
+Compares the slotted Article against an equivalent __dict__-backed
+instance, and the dict + json.dumps save path against the streaming
+JsonWriter that runs use
+
+Usage:
+    python benchmarks/bench_article.py
+    python benchmarks/bench_article.py --count 20000 --text-bytes 8000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import DATA_LITE_MODE
+from scrapers.base_scraper import Article, local_naive
+from utils.json_writer import JsonWriter
+
+
+class DictArticle:
+    """
+    Same fields, constructor and serialization as Article, but without
+    __slots__, so fields live in a per-instance __dict__ (how Article was
+    laid out before it was slotted). Deliberately not a subclass: it would
+    inherit the slots and leave __dict__ empty
+    """
+
+    def __init__(
+        self,
+        title: str,
+        url: str,
+        snippet: str,
+        source_name: str,
+        published_at: Optional[datetime] = None,
+        image_url: Optional[str] = None,
+        author: Optional[str] = None,
+        full_text: Optional[str] = None,
+        cluster_key: Optional[str] = None
+    ):
+        self.title = title
+        self.url = url
+        self.snippet = snippet
+        self.source_name = source_name
+        self.published_at = local_naive(published_at)
+        self.image_url = image_url if not DATA_LITE_MODE else None
+        self.author = author
+        self.full_text = full_text
+        self.cluster_key = cluster_key
+
+    def to_dict(self) -> Dict:
+        return {
+            "title": self.title,
+            "url": self.url,
+            "snippet": self.snippet,
+            "source_name": self.source_name,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "image_url": self.image_url,
+            "author": self.author,
+            "full_text": self.full_text,
+            "cluster_key": self.cluster_key
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+
+def make_articles(cls, count: int, text_bytes: int) -> list:
+    return [
+        cls(
+            title=f"Manchete número {i} sobre a política nacional",
+            url=f"https://g1.globo.com/politica/noticia/2026/01/06/materia-{i}.ghtml",
+            snippet=f"Resumo da matéria {i}. Segunda frase do resumo.",
+            source_name="G1",
+            author="Redação g1",
+            full_text=("Parágrafo de texto completo da matéria. " * (text_bytes // 40))[:text_bytes]
+        )
+        for i in range(count)
+    ]
+
+
+def measure_instances(cls, count: int) -> float:
+    """
+    Bytes allocated per instance, excluding the field strings themselves
+    (they are created up front and shared by every instance)
+    """
+    fields = dict(
+        title="t", url="u", snippet="s", source_name="G1", author="a", full_text="f",
+        published_at=datetime(2026, 1, 6, 12, 30)
+    )
+    make = lambda: cls(**fields)
+    make()  # warm up
+
+    tracemalloc.start()
+    instances = [make() for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    list_overhead = sys.getsizeof(instances)
+    return (current - list_overhead) / count
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def time_call(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Article memory and serialization")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--text-bytes", type=int, default=4000, help="Full text size per article")
+    args = parser.parse_args()
+
+    assert make_articles(DictArticle, 1, 10)[0].__dict__, "DictArticle must keep its fields in __dict__"
+
+    dict_size = measure_instances(DictArticle, args.count)
+    slot_size = measure_instances(Article, args.count)
+
+    print(f"Per-article object overhead ({args.count} instances, strings excluded):")
+    print(f"  __dict__ Article: {dict_size:.0f} bytes")
+    print(f"  slotted Article:  {slot_size:.0f} bytes ({(1 - slot_size / dict_size) * 100:.0f}% less)")
+
+    articles = make_articles(Article, args.count, args.text_bytes)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp)
+
+        def dict_path():
+            payload = json.dumps({"articles": [a.to_dict() for a in articles]}, ensure_ascii=False)
+            (output_dir / "dict.json").write_bytes(payload.encode("utf-8"))
+
+        def stream_path() -> Path:
+            with JsonWriter("bench", output_dir) as writer:
+                for article in articles:
+                    writer.write(article)
+            return writer.path
+
+        expected = json.loads(json.dumps([a.to_dict() for a in articles]))
+        assert json.loads(stream_path().read_bytes())["articles"] == expected
+
+        dict_time, dict_peak = time_call(dict_path), peak_memory(dict_path)
+        stream_time, stream_peak = time_call(stream_path), peak_memory(stream_path)
+
+    print(f"Save {args.count} articles ({args.text_bytes} B full text each) to a file:")
+    print(f"  to_dict + json.dumps: {dict_time * 1000:.1f} ms, peak {dict_peak / 2**20:.1f} MiB")
+    print(f"  JsonWriter:           {stream_time * 1000:.1f} ms, peak {stream_peak / 2**20:.1f} MiB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Homepage Parse Benchmark
+Splits a spec scraper's homepage work into lxml parse and compiled-rule
+extraction on a saved homepage, next to a plain BeautifulSoup parse of
+the same page for reference
+
+Usage:
+    python benchmarks/bench_parse.py --source g1 --html benchmarks/fixtures/g1_homepage.html
+    python benchmarks/bench_parse.py --source folha --html folha.html --runs 50
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from scrapers.registry import available_sources, create_scraper
+
+
+def time_runs(func, runs: int) -> list:
+    """
+    Wall-clock durations (seconds) of `runs` calls to func
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark homepage parsing and extraction")
+    parser.add_argument("--source", required=True, choices=available_sources())
+    parser.add_argument("--html", required=True, type=Path, help="Saved homepage HTML")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    scraper = create_scraper(args.source)
+    content = args.html.read_bytes()
+    root = scraper.parse_html(content)
+    articles = scraper.parse_homepage(root)
+
+    soup = time_runs(lambda: BeautifulSoup(content, "lxml"), args.runs)
+    parse = time_runs(lambda: scraper.parse_html(content), args.runs)
+    extract = time_runs(lambda: scraper.parse_homepage(root), args.runs)
+
+    print(f"{scraper.source_name}: {len(content) / 1024:.0f} KiB, {args.runs} runs, {len(articles)} articles")
+    print(f"  BeautifulSoup parse: median {statistics.median(soup) * 1000:.1f} ms (reference)")
+    print(f"  parse:               median {statistics.median(parse) * 1000:.1f} ms")
+    print(f"  extract:             median {statistics.median(extract) * 1000:.1f} ms")
+
+    return 0 if articles else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Parse Pool Benchmark
+Article pages per second parsed inline (in the scraper's thread) versus
+on the parse pool, from a saved article page. The pool only pays off with
+more than one core: check the CPU count printed first
+
+Usage:
+    python benchmarks/bench_parse_pool.py
+    python benchmarks/bench_parse_pool.py --source folha --pages 400 --workers 2 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import PARSE_QUEUE_SIZE
+from scrapers.registry import create_scraper
+from utils.http_cache import FetchResult
+from utils.parse_pool import parse_pool
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+async def parse_all(scraper, result: FetchResult, pages: int) -> int:
+    """
+    Parse the same page `pages` times, as many in flight as the pool queue allows
+    """
+    url = f"{scraper.base_url}bench"
+    articles = await asyncio.gather(*(scraper.parse_article_async(url, result) for _ in range(pages)))
+    return sum(1 for article in articles if article is not None)
+
+
+def pages_per_second(scraper, result: FetchResult, pages: int) -> float:
+    start = time.perf_counter()
+    parsed = asyncio.run(parse_all(scraper, result, pages))
+    elapsed = time.perf_counter() - start
+
+    if parsed != pages:
+        raise RuntimeError(f"Only {parsed} of {pages} pages parsed")
+    return pages / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the article parse pool")
+    parser.add_argument("--source", default="g1")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    args = parser.parse_args()
+
+    scraper = create_scraper(args.source)
+    content = (FIXTURES_DIR / f"{args.source}_article.html").read_bytes()
+    result = FetchResult(content=content, unchanged=False, content_type="text/html; charset=utf-8")
+
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    print(f"{scraper.source_name}: {args.pages} article pages, {cpus} CPU(s), queue size {PARSE_QUEUE_SIZE}")
+
+    parse_pool.configure(0)
+    inline = pages_per_second(scraper, result, args.pages)
+    print(f"  inline:     {inline:.0f} pages/s")
+
+    for workers in args.workers:
+        parse_pool.configure(workers)
+        pages_per_second(scraper, result, workers * 4)  # start the workers and compile their rules
+
+        pooled = pages_per_second(scraper, result, args.pages)
+        print(f"  {workers} workers:  {pooled:.0f} pages/s ({pooled / inline:.2f}x inline)")
+        parse_pool.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
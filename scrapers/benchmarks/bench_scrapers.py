@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Offline Scraper Benchmark
+Runs scrape_homepage and scrape_article_details for every source against
+the HTML fixtures in benchmarks/fixtures/ (fetch_page stubbed, no network)
+and reports articles/second and peak memory
+Throughput depends on the machine, so the regression gate is opt-in and
+compares with a baseline recorded on the same machine (baseline.json,
+not checked in)
+
+Usage:
+    python benchmarks/bench_scrapers.py                  # Report numbers only
+    python benchmarks/bench_scrapers.py --source g1 --runs 50
+    python benchmarks/bench_scrapers.py --save-baseline  # Record this machine's baseline
+    python benchmarks/bench_scrapers.py --check          # Fail on regressions vs that baseline
+    python benchmarks/bench_scrapers.py --capture        # Refresh fixtures from the live sites
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.registry import create_scraper
+from utils.http_cache import FetchResult
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+# Sources with fixtures -> article URL passed to scrape_article_details
+ARTICLE_URLS = {
+    "g1": "https://g1.globo.com/politica/noticia/2026/01/06/fixture.ghtml",
+    "folha": "https://www1.folha.uol.com.br/poder/2026/01/fixture.shtml",
+    "estadao": "https://www.estadao.com.br/politica/fixture/"
+}
+
+
+def fixture_path(source: str, page: str) -> Path:
+    return FIXTURES_DIR / f"{source}_{page}.html"
+
+
+def stub_fetch_page(scraper, content: bytes):
+    """
+    Replace fetch_page with one that parses `content` exactly like a
+    successful fetch would (same charset handling)
+    """
+    result = FetchResult(content=content, unchanged=False, content_type="text/html; charset=utf-8")
+
+    def fetch_page(url, skip_unchanged=False, hold=False):
+        return scraper._parse_result(url, result, skip_unchanged)
+
+    scraper.fetch_page = fetch_page
+
+
+def measure(func, runs: int) -> dict:
+    """
+    articles/second over `runs` calls, and peak traced memory of one call
+    """
+    count = len(func() or [])  # warm up (also the per-call article count)
+    if count == 0:
+        raise RuntimeError("fixture produced no articles (selectors no longer match?)")
+
+    # Fastest call with GC paused: least affected by other load (as timeit does)
+    durations = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    call_time = min(durations)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "articles_per_call": count,
+        "articles_per_sec": round(count / call_time, 1),
+        "peak_kib": round(peak / 1024)
+    }
+
+
+def bench_source(source: str, runs: int) -> dict:
+    scraper = create_scraper(source)
+    results = {}
+
+    stub_fetch_page(scraper, fixture_path(source, "homepage").read_bytes())
+    results["scrape_homepage"] = measure(scraper.scrape_homepage, runs)
+
+    stub_fetch_page(scraper, fixture_path(source, "article").read_bytes())
+    url = ARTICLE_URLS[source]
+    results["scrape_article_details"] = measure(lambda: [scraper.scrape_article_details(url)], runs)
+
+    return results
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Regressions beyond tolerance: throughput below or peak memory above baseline
+    """
+    regressions = []
+
+    for source, stages in current.items():
+        for stage, numbers in stages.items():
+            base = baseline.get(source, {}).get(stage)
+            if not base:
+                continue
+
+            if numbers["articles_per_sec"] < base["articles_per_sec"] * (1 - tolerance):
+                regressions.append(
+                    f"{source} {stage}: {numbers['articles_per_sec']} articles/s "
+                    f"(baseline {base['articles_per_sec']})"
+                )
+            if numbers["peak_kib"] > base["peak_kib"] * (1 + tolerance):
+                regressions.append(
+                    f"{source} {stage}: peak {numbers['peak_kib']} KiB (baseline {base['peak_kib']})"
+                )
+
+    return regressions
+
+
+def machine() -> str:
+    """
+    Identifies where a baseline was recorded
+    """
+    return (
+        f"{platform.node()}: {platform.python_implementation()} {platform.python_version()}, "
+        f"{platform.machine()}"
+    )
+
+
+def capture(sources: list):
+    """
+    Save each live homepage and its first article page as fixtures
+    """
+    FIXTURES_DIR.mkdir(exist_ok=True)
+
+    for source in sources:
+        scraper = create_scraper(source)
+
+        homepage = scraper.fetch_content(scraper.base_url)
+        if homepage is None:
+            print(f"✗ {source}: homepage fetch failed", file=sys.stderr)
+            continue
+        fixture_path(source, "homepage").write_bytes(homepage.content)
+
+        stub_fetch_page(scraper, homepage.content)
+        articles = scraper.scrape_homepage()
+        if not articles:
+            print(f"✗ {source}: no articles found on the live homepage", file=sys.stderr)
+            continue
+
+        article = scraper.fetch_content(articles[0].url)
+        if article is None:
+            print(f"✗ {source}: article fetch failed ({articles[0].url})", file=sys.stderr)
+            continue
+        fixture_path(source, "article").write_bytes(article.content)
+
+        print(f"✓ {source}: captured homepage and {articles[0].url}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scrapers offline against HTML fixtures")
+    parser.add_argument("--source", choices=ARTICLE_URLS.keys(), help="Only this source (default: all)")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed regression vs baseline (default: 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write results to {BASELINE_FILE.name} (this machine only)")
+    parser.add_argument("--check", action="store_true", help=f"Exit 1 on regressions vs {BASELINE_FILE.name}")
+    parser.add_argument("--capture", action="store_true", help="Refresh fixtures from the live sites")
+    args = parser.parse_args()
+
+    # Keep per-article log lines out of the timings
+    logging.disable(logging.INFO)
+
+    sources = [args.source] if args.source else list(ARTICLE_URLS)
+
+    if args.capture:
+        logging.disable(logging.NOTSET)
+        capture(sources)
+        return 0
+
+    current = {source: bench_source(source, args.runs) for source in sources}
+
+    for source, stages in current.items():
+        for stage, numbers in stages.items():
+            print(
+                f"{source:8} {stage:24} {numbers['articles_per_sec']:>10.1f} articles/s"
+                f"  peak {numbers['peak_kib']:>6} KiB  ({numbers['articles_per_call']} per call)"
+            )
+
+    if args.save_baseline:
+        baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+        baseline.update(current)
+        baseline["_machine"] = machine()
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+        return 0
+
+    if not args.check:
+        return 0
+
+    if not BASELINE_FILE.exists():
+        print("No baseline on this machine yet; run with --save-baseline first")
+        return 1
+
+    baseline = json.loads(BASELINE_FILE.read_text())
+    if baseline.get("_machine") != machine():
+        print(f"Baseline was recorded on {baseline.get('_machine')!r}, not here ({machine()!r}); re-record it with --save-baseline")
+        return 1
+
+    regressions = compare(current, baseline, args.tolerance)
+    if regressions:
+        print(f"\nRegressions beyond {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  ✗ {line}")
+        return 1
+
+    print(f"\n✓ No regressions beyond {args.tolerance:.0%} of the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
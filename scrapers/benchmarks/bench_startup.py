@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+Times fresh interpreter starts for the steps a short cron run or a
+per-source worker pays before its first request (median of N runs),
+plus the slowest imports for one source (python -X importtime)
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --source folha
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRAPERS_DIR = Path(__file__).parent.parent
+
+# name -> code run in a fresh interpreter from the scrapers directory
+STEPS = {
+    "python (empty)": "pass",
+    "import config": "import config",
+    "run_scrapers --help": "import sys; sys.argv = ['run_scrapers.py', '--help']; import runpy; runpy.run_path('run_scrapers.py', run_name='__main__')",
+    "one scraper": "from scrapers.registry import create_scraper; create_scraper({source!r})",
+    "all scrapers": "from scrapers.registry import available_sources, create_scrapers; create_scrapers(available_sources())"
+}
+
+
+def time_step(code: str, runs: int) -> float:
+    """
+    Median wall seconds of `runs` fresh interpreters running code
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code], cwd=SCRAPERS_DIR,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+        )
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def slowest_imports(code: str, limit: int) -> list:
+    """
+    Top-level imports by cumulative microseconds (-X importtime)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=SCRAPERS_DIR,
+        capture_output=True, text=True, check=False
+    )
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Top-level modules only: nested imports are indented under them
+        if not name.startswith("  "):
+            imports.append((int(cumulative), name.strip()))
+
+    return sorted(imports, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI and scraper startup time")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--source", default="g1", help="Source for the single-scraper step (default: g1)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    for name, code in STEPS.items():
+        seconds = time_step(code.format(source=args.source), args.runs)
+        print(f"{name:22} {seconds * 1000:8.0f} ms")
+
+    print(f"\nSlowest imports for one {args.source} scraper:")
+    for cumulative, module in slowest_imports(STEPS["one scraper"].format(source=args.source), args.top):
+        print(f"{cumulative / 1000:8.1f} ms  {module}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
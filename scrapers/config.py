@@ -14,17 +14,130 @@ load_dotenv()
 BASE_DIR = Path(__file__).parent
 OUTPUT_DIR = BASE_DIR / "output"
 LOGS_DIR = BASE_DIR / "logs"
+CACHE_DIR = BASE_DIR / "cache"
+
+
+def ensure_dirs():
+    """
+    Create the output, logs and cache directories
+    Called by the entry points that write rather than at import, so
+    read-only tools (--help, articles_cli.py) don't touch the disk
+    """
+    for directory in (OUTPUT_DIR, LOGS_DIR, CACHE_DIR):
+        directory.mkdir(exist_ok=True)
 
-# Ensure directories exist
-OUTPUT_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
 
 # Scraper settings
 USER_AGENT = "EspectroBot/1.0 (+https://espectro.app; contact@espectro.app)"
 REQUEST_TIMEOUT = 10  # seconds
 MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 1.0  # seconds; doubles per attempt, full jitter
+RETRY_BACKOFF_MAX = 30.0  # cap on a single backoff sleep
+RETRY_AFTER_MAX = 120.0  # longest Retry-After we wait out; longer ones end the retries
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failures before a domain is skipped
+CIRCUIT_COOLDOWN = 300  # seconds a tripped domain is skipped before probing again
 CRAWL_DELAY = 2  # seconds between requests (respectful scraping)
 
+# Per-domain token bucket, shared by all scraper processes on this host
+# Refills one token per crawl delay; BURST is how many requests may go back-to-back
+RATE_LIMIT_DB = CACHE_DIR / "rate_limits.db"
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "1"))
+
+# HTTP cache (conditional GET)
+# Unchanged homepages are answered from disk and not re-parsed
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_MB", "100")) * 1024 * 1024
+
+# RSS/Atom ingestion
+# Each source's feed (SOURCES[...]["rss"]) is read first; the HTML homepage is the fallback
+USE_RSS_FEEDS = os.getenv("USE_RSS_FEEDS", "true").lower() == "true"
+FEED_MAX_ITEMS = 50  # items taken from a feed per run
+
+# Incremental crawl
+# Articles already emitted by an earlier run (same URL, same title/snippet) are skipped
+INCREMENTAL_CRAWL = os.getenv("INCREMENTAL_CRAWL", "true").lower() == "true"
+SEEN_INDEX_DB = CACHE_DIR / "seen_urls.db"
+SEEN_BLOOM_CAPACITY = 1_000_000  # URLs before the false-positive rate degrades
+SEEN_BLOOM_ERROR_RATE = 0.01
+
+# URL canonicalization
+# Article URLs are normalized before dedup/output: https, lowercase host,
+# host aliases folded, tracking params and fragments dropped
+CANONICAL_HOST_ALIASES = {
+    "folha.uol.com.br": "www1.folha.uol.com.br",
+    "www.folha.uol.com.br": "www1.folha.uol.com.br",
+}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid", "cmpid", "origin", "ref", "_ga"}
+
+# Near-duplicate detection
+# SimHash of title + snippet, compared across all sources and recent runs, so
+# wire copy republished by several outlets is dropped before enrichment/output
+NEAR_DUP_DETECTION = os.getenv("NEAR_DUP_DETECTION", "true").lower() == "true"
+NEAR_DUP_DB = CACHE_DIR / "near_duplicates.db"
+NEAR_DUP_MAX_DISTANCE = int(os.getenv("NEAR_DUP_MAX_DISTANCE", "8"))  # differing bits out of 64
+NEAR_DUP_WINDOW_HOURS = int(os.getenv("NEAR_DUP_WINDOW_HOURS", "72"))
+NEAR_DUP_MIN_TOKENS = 6  # shorter texts ("Ao vivo", section labels) are never flagged
+
+# Story clustering
+# MinHash LSH over normalized headlines (same normalization as the backend's
+# normalizeHeadline); each article is written with the cluster_key of its story
+STORY_CLUSTERING = os.getenv("STORY_CLUSTERING", "true").lower() == "true"
+CLUSTER_DB = CACHE_DIR / "story_clusters.db"
+CLUSTER_SIMILARITY = float(os.getenv("CLUSTER_SIMILARITY", "0.5"))  # estimated Jaccard to join a cluster
+CLUSTER_WINDOW_HOURS = int(os.getenv("CLUSTER_WINDOW_HOURS", "48"))  # matches the backend's news-cycle window
+CLUSTER_NUM_PERM = 128  # MinHash permutations
+CLUSTER_BANDS = 32  # LSH bands (rows per band = NUM_PERM / BANDS)
+
+# Output format
+# "json": one indented file per source per run (read by the backend ingestion script)
+# "ndjson": one line per article, flushed as it is extracted, under output/stream/
+OUTPUT_FORMAT = os.getenv("OUTPUT_FORMAT", "json").lower()
+OUTPUT_COMPRESSION = os.getenv("OUTPUT_COMPRESSION", "none").lower()  # none, gzip or zstd (NDJSON only)
+NDJSON_OUTPUT_DIR = OUTPUT_DIR / "stream"
+NDJSON_ROTATE_BYTES = int(os.getenv("NDJSON_ROTATE_MB", "64")) * 1024 * 1024
+NDJSON_ROTATE_SECONDS = int(os.getenv("NDJSON_ROTATE_MINUTES", "60")) * 60
+
+# Local article store
+# Every run is also bulk-inserted into a SQLite (WAL) database; see articles_cli.py
+ARTICLE_STORE_ENABLED = os.getenv("ARTICLE_STORE_ENABLED", "true").lower() == "true"
+ARTICLE_STORE_DB = OUTPUT_DIR / "articles.db"
+
+# Streaming pipeline
+# run() passes articles one at a time from extraction to the sinks; batched
+# sinks (article store, --ingest, the seen-URL index) commit every
+# PIPELINE_BATCH_SIZE articles and once more when the run ends, even on failure
+PIPELINE_BATCH_SIZE = int(os.getenv("PIPELINE_BATCH_SIZE", "50"))
+
+# Concurrency
+# Each source runs on its own worker thread; crawl delays are per-domain
+MAX_SOURCE_WORKERS = int(os.getenv("MAX_SOURCE_WORKERS", "8"))
+# Async fetch engine: total open requests and open requests per host
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "200"))
+PER_HOST_CONCURRENCY = int(os.getenv("PER_HOST_CONCURRENCY", "4"))
+
+# Full-text enrichment
+# When enabled, run() also fetches each homepage article's detail page
+ENRICH_FULL_TEXT = os.getenv("ENRICH_FULL_TEXT", "false").lower() == "true"
+ENRICH_CONCURRENCY = int(os.getenv("ENRICH_CONCURRENCY", "8"))  # detail pages in flight per source
+
+# Parse workers (run_scrapers.py --parse-workers)
+# Enrichment hands spec-driven sources' fetched detail pages to this many
+# processes for parsing and extraction, so parsing uses more than one core;
+# 0 parses in the scraper thread. Slower on a single core: check with
+# benchmarks/bench_parse_pool.py before enabling
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0"))
+PARSE_QUEUE_SIZE = int(os.getenv("PARSE_QUEUE_SIZE", "16"))  # fetched pages waiting for a worker, per source
+
+# Daemon mode (run_scrapers.py --daemon)
+# Each source starts at SOURCES[...]["poll_interval"] seconds, then polls faster
+# while it publishes and slower while it is quiet, within these bounds
+DAEMON_DEFAULT_INTERVAL = 300  # sources without a poll_interval (entry point plugins)
+DAEMON_MIN_INTERVAL = float(os.getenv("DAEMON_MIN_INTERVAL", "60"))
+DAEMON_MAX_INTERVAL = float(os.getenv("DAEMON_MAX_INTERVAL", "1800"))
+DAEMON_SHUTDOWN_TIMEOUT = float(os.getenv("DAEMON_SHUTDOWN_TIMEOUT", "120"))  # wait for in-flight polls on exit
+
 # Data-Lite Mode
 # When enabled, ignores high-res images and focuses on text + metadata
 DATA_LITE_MODE = os.getenv("DATA_LITE_MODE", "true").lower() == "true"
@@ -34,15 +147,58 @@ DATABASE_URL = os.getenv("DATABASE_URL", "")
 SUPABASE_URL = os.getenv("SUPABASE_URL", "")
 SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
 
+# Bulk ingestion (run_scrapers.py --ingest, ingest_articles.py)
+# Writes straight to the articles table: DATABASE_URL (postgresql://... or a
+# sqlite:///path.db stand-in), else the Supabase REST API
+DB_INGEST_ENABLED = os.getenv("DB_INGEST_ENABLED", "false").lower() == "true"
+DB_INGEST_BATCH_SIZE = int(os.getenv("DB_INGEST_BATCH_SIZE", "500"))  # rows per INSERT statement
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))  # max pooled Postgres connections
+
 # Backend API endpoint (alternative to direct DB)
 BACKEND_API_URL = os.getenv("BACKEND_API_URL", "http://localhost:3000/api/v1")
+SCRAPER_API_KEY = os.getenv("SCRAPER_API_KEY", "")  # Bearer token; the backend refuses pushes without one
+
+# Push sink (run_scrapers.py --push)
+# Articles are POSTed to the backend in gzip batches as they are extracted;
+# batches that can't be sent (backend slow or down) wait in PUSH_SPOOL_DIR
+PUSH_ENABLED = os.getenv("PUSH_ENABLED", "false").lower() == "true"
+PUSH_ENDPOINT = f"{BACKEND_API_URL}/articles/batch"
+PUSH_BATCH_ARTICLES = int(os.getenv("PUSH_BATCH_ARTICLES", "50"))
+PUSH_BATCH_BYTES = int(os.getenv("PUSH_BATCH_KB", "1024")) * 1024  # uncompressed JSON per batch
+PUSH_BATCH_SECONDS = float(os.getenv("PUSH_BATCH_SECONDS", "5"))  # oldest article waits at most this long
+PUSH_MAX_IN_FLIGHT = int(os.getenv("PUSH_MAX_IN_FLIGHT", "2"))  # concurrent POSTs before batches spill
+PUSH_TIMEOUT = 15  # seconds per POST
+PUSH_SPOOL_DIR = CACHE_DIR / "push_queue"
 
 # News sources configuration
+# "extract" is the declarative extraction spec (see utils/extraction.py for the
+# selector syntax): a source with only a spec is scraped by SpecScraper.
+# "scraper" optionally names a "module:Class" to use instead; either is only
+# imported when the source runs. Packages can add sources via the
+# "espectro.scrapers" entry point group
 SOURCES = {
     "g1": {
         "name": "G1",
         "url": "https://g1.globo.com",
         "rss": "https://g1.globo.com/rss/g1/",
+        "poll_interval": 180,  # daemon mode starting interval (seconds)
+        "extract": {
+            "homepage": {
+                "container": "div.feed-post-body",
+                "limit": 20,
+                "link": "a.feed-post-link",
+                "snippet": "div.feed-post-body-resumo",
+                "image": "preceding::img.bstn-fd-picture-image@src"
+            },
+            "article": {
+                "title": "h1.content-head__title",
+                "snippet": "h2.content-head__subtitle",
+                "body": "div.mc-article-body",
+                "author": "p.content-publication-data__from",
+                "time": "time@datetime",
+                "image": "div.progressive-img-container img@src"
+            }
+        },
         "source_id": None,  # Will be populated from database
         "bias_scores": {
             "economic": 0,  # Centrist on economy
@@ -54,6 +210,27 @@ SOURCES = {
         "name": "Folha de S.Paulo",
         "url": "https://www.folha.uol.com.br",
         "rss": "https://feeds.folha.uol.com.br/poder/rss091.xml",
+        "poll_interval": 300,
+        "extract": {
+            "homepage": {
+                "container": "div.c-headline",
+                "limit": 20,
+                "link": ["a.c-headline__url", "a"],
+                "title": ["h2", "h3", "."],
+                "snippet": "p.c-headline__standfirst",
+                "image": "img@data-src|src"
+            },
+            "article": {
+                "title": "h1.c-content-head__title",
+                "snippet": "h2.c-content-head__subtitle",
+                "body": "div.c-news__body",
+                "paragraphs": ["p.c-news__paragraph", "p"],
+                "paywall": ["Cadastre-se gratuitamente", "Assine a Folha"],
+                "author": "p.c-signature__author",
+                "time": "time.c-signature__time@datetime",
+                "image": "div.c-news__image img@data-src|src"
+            }
+        },
         "source_id": None,
         "bias_scores": {
             "economic": 1,
@@ -65,6 +242,30 @@ SOURCES = {
         "name": "O Estado de S. Paulo",
         "url": "https://www.estadao.com.br",
         "rss": "https://www.estadao.com.br/rss/politica.xml",
+        "poll_interval": 300,
+        "extract": {
+            "homepage": {
+                "container": ["div.noticia", "article"],
+                "limit": 15,
+                "fallback_below": 10,
+                "link": "a",
+                "title": ["h2", "h3", "span.titulo", "."],
+                "min_title_length": 20,  # shorter links are navigation
+                "snippet": ["p.intro", "p"],
+                "image": "img@data-src|src"
+            },
+            "article": {
+                "title": "h1",
+                "snippet": ["h2.subtitle", "p.intro"],
+                "body": ["article", "div.content"],
+                "min_paragraph_length": 51,  # skips captions and bylines
+                "paywall": ["Assine o Estadão", "Cadastro gratuito"],
+                "author": ["span.autor", "a.autor"],
+                "time": ["time@datetime|text", "span.data@datetime|text"],
+                "time_formats": ["%d/%m/%Y"],
+                "image": ["figure img@data-src|src", "div.foto img@data-src|src"]
+            }
+        },
         "source_id": None,
         "bias_scores": {
             "economic": 2,  # More market-oriented
@@ -75,9 +276,32 @@ SOURCES = {
 }
 
 # Robots.txt cache
+# In-memory per process, backed by a SQLite file shared across runs/processes
 ROBOTS_CACHE = {}
+ROBOTS_CACHE_DB = CACHE_DIR / "robots.db"
+ROBOTS_CACHE_TTL = int(os.getenv("ROBOTS_CACHE_TTL_HOURS", "24")) * 3600
+ROBOTS_FAILURE_TTL = 600  # seconds before retrying a failed robots.txt fetch
 
 # Logging configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT = "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Run metrics
+# Per-source stage timings, bytes downloaded, HTTP statuses and retries,
+# written after each run as a JSON summary and a Prometheus textfile
+# (point METRICS_TEXTFILE into node_exporter's --collector.textfile.directory).
+# Each process writes its own copy, suffixed with its scope: "all", the
+# source key, or "daemon-" plus either (espectro_scrapers.daemon-all.prom)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+METRICS_SUMMARY_FILE = LOGS_DIR / "run_summary.json"
+METRICS_TEXTFILE = Path(os.getenv("METRICS_TEXTFILE", str(LOGS_DIR / "espectro_scrapers.prom")))
+
+# Profiling (run_scrapers.py --profile)
+# "full": cProfile + tracemalloc per run (slow, runs serialized);
+# "sample": periodic stack sampling, cheap enough to leave on
+PROFILE_MODE = os.getenv("PROFILE_MODE", "off").lower()
+PROFILE_DIR = LOGS_DIR / "profiles"
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "10")) / 1000
+PROFILE_TOP_N = 30  # functions / allocation sites per report
+PROFILE_KEEP = 50  # newest reports kept per source
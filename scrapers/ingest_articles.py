@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Espectro Bulk Ingestion
+Insert scraper output files into the backend database in multi-row batches
+(Python counterpart of backend/src/scripts/process-scraped-articles.ts,
+without the per-article round-trips)
+
+Usage:
+    python ingest_articles.py output/g1_20260106_120000.json
+    python ingest_articles.py --all                               # Every output/*.json file
+    python ingest_articles.py --all --dsn sqlite:///cache/ingest_test.db  # SQLite stand-in
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import OUTPUT_DIR, LOG_DATE_FORMAT
+from utils.db_ingest import DbIngester, db_ingester
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-insert scraper output into the articles table")
+    parser.add_argument("files", nargs="*", type=Path, help="Scraper JSON output files")
+    parser.add_argument("--all", action="store_true", help="Ingest every output/*.json file")
+    parser.add_argument("--dsn", help="Override DATABASE_URL (postgresql://... or sqlite:///path.db)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s", datefmt=LOG_DATE_FORMAT)
+
+    files = sorted(OUTPUT_DIR.glob("*.json")) if args.all else args.files
+    if not files:
+        parser.error("give one or more files, or --all")
+
+    ingester = DbIngester(dsn=args.dsn) if args.dsn else db_ingester
+    total = 0
+
+    try:
+        for path in files:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"✗ {path}: {e}", file=sys.stderr)
+                continue
+
+            scraped_at = data.get("scraped_at")
+            count = ingester.ingest_rows(
+                dict(article, scraped_at=scraped_at) for article in data.get("articles", [])
+            )
+            total += count
+            print(f"✓ {path}: {count} new articles")
+    finally:
+        ingester.close()
+
+    print(f"Ingested {total} new articles from {len(files)} files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
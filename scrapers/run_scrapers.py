@@ -7,28 +7,50 @@ Usage:
     python run_scrapers.py              # Run all scrapers
     python run_scrapers.py --source g1  # Run specific scraper
     python run_scrapers.py --lite       # Force Data-Lite mode
+    python run_scrapers.py --workers 1  # Run sources one at a time
+    python run_scrapers.py --full-text  # Also fetch article pages for full text
+    python run_scrapers.py --all        # Include articles seen in earlier runs
+    python run_scrapers.py --format ndjson  # Stream one JSON line per article
+    python run_scrapers.py --daemon     # Keep polling each source on an adaptive interval
+    python run_scrapers.py --ingest     # Also bulk-insert new articles into the database
+    python run_scrapers.py --push       # Also POST new articles to BACKEND_API_URL as they are extracted
+    python run_scrapers.py --full-text --parse-workers 4  # Parse article pages on 4 processes
+    python run_scrapers.py --profile    # Write per-source cProfile/tracemalloc reports to logs/profiles/
+    python run_scrapers.py --profile sample  # Low-overhead stack sampling instead
 """
 
 import argparse
 import logging
+import signal
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from scrapers.g1_scraper import G1Scraper
-from scrapers.folha_scraper import FolhaScraper
-from scrapers.estadao_scraper import EstadaoScraper
-from config import LOG_LEVEL, LOG_FORMAT, LOG_DATE_FORMAT, LOGS_DIR, DATA_LITE_MODE
-
-import colorlog
+# Scraper modules (bs4, requests, lxml, aiohttp) are imported by the
+# registry only for the sources being run
+from config import (
+    LOG_LEVEL, LOG_FORMAT, LOG_DATE_FORMAT, LOGS_DIR, DATA_LITE_MODE,
+    MAX_SOURCE_WORKERS, ENRICH_FULL_TEXT, INCREMENTAL_CRAWL, OUTPUT_FORMAT, DB_INGEST_ENABLED, PUSH_ENABLED,
+    SOURCES, PARSE_WORKERS, DAEMON_DEFAULT_INTERVAL, DAEMON_SHUTDOWN_TIMEOUT, PROFILE_MODE, ensure_dirs
+)
+from scrapers.registry import available_sources, create_scraper, create_scrapers, has_source
+from utils.metrics import metrics
+from utils.parse_pool import parse_pool
+from utils.profiler import profiler
+from utils.scheduler import AdaptiveInterval, SourceLoop
 
 
 def setup_logging():
     """
     Configure logging with colors
     """
+    import colorlog
+
     handler = colorlog.StreamHandler()
     handler.setFormatter(colorlog.ColoredFormatter(
         LOG_FORMAT,
@@ -56,31 +78,55 @@ def setup_logging():
     root_logger.addHandler(file_handler)
 
 
-def run_all_scrapers():
+def run_scraper(scraper, **run_options) -> int:
     """
-    Run all available scrapers
+    Run one scraper, logging its banner; returns the articles written
+    run_options are passed to BaseScraper.run; exceptions propagate.
+    Each run is profiled on its own when profiling is on
     """
-    scrapers = [
-        G1Scraper(),
-        FolhaScraper(),
-        EstadaoScraper()
-    ]
+    logging.info(f"\n{'='*60}")
+    logging.info(f"Running: {scraper.source_name}")
+    logging.info(f"{'='*60}")
+
+    with profiler.profile(scraper.source_name):
+        return scraper.run(**run_options)
+
+
+def run_and_close(scraper, **run_options) -> int:
+    """
+    run_scraper for a one-off run: the scraper's sessions and event loop
+    are closed on its own thread once it is done
+    """
+    try:
+        return run_scraper(scraper, **run_options)
+    finally:
+        scraper.close()
+
 
+def run_all_scrapers(max_workers: int = None, **run_options):
+    """
+    Run all available scrapers concurrently, one worker per source
+    Per-domain crawl delays still apply inside each scraper, so sources
+    only overlap with each other, never with themselves
+    """
+    scrapers = list(create_scrapers(available_sources()).values())
+
+    workers = max_workers or min(MAX_SOURCE_WORKERS, len(scrapers))
     total_articles = 0
 
-    for scraper in scrapers:
-        try:
-            logging.info(f"\n{'='*60}")
-            logging.info(f"Running: {scraper.source_name}")
-            logging.info(f"{'='*60}")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as executor:
+        futures = [executor.submit(run_and_close, scraper, **run_options) for scraper in scrapers]
 
-            articles = scraper.run()
-            total_articles += len(articles)
+        # Collect in submission order so output matches a sequential run
+        for scraper, future in zip(scrapers, futures):
+            try:
+                count = future.result()
+                total_articles += count
 
-            logging.info(f"✓ {scraper.source_name}: {len(articles)} articles scraped")
+                logging.info(f"✓ {scraper.source_name}: {count} articles scraped")
 
-        except Exception as e:
-            logging.error(f"✗ Failed to run {scraper.source_name}: {e}", exc_info=True)
+            except Exception as e:
+                logging.error(f"✗ Failed to run {scraper.source_name}: {e}", exc_info=True)
 
     logging.info(f"\n{'='*60}")
     logging.info(f"SUMMARY: {total_articles} total articles scraped")
@@ -89,36 +135,104 @@ def run_all_scrapers():
     return total_articles
 
 
-def run_single_scraper(source_name: str):
+def run_single_scraper(source_name: str, **run_options):
     """
-    Run a specific scraper
+    Run a specific scraper (only its module is imported)
     """
-    scrapers = {
-        "g1": G1Scraper(),
-        "folha": FolhaScraper(),
-        "estadao": EstadaoScraper()
-    }
-
     source_key = source_name.lower()
 
-    if source_key not in scrapers:
+    if not has_source(source_key):
         logging.error(f"Unknown source: {source_name}")
-        logging.info(f"Available sources: {', '.join(scrapers.keys())}")
+        logging.info(f"Available sources: {', '.join(available_sources())}")
         return 0
 
-    scraper = scrapers[source_key]
+    count = run_and_close(create_scraper(source_key), **run_options)
 
     logging.info(f"\n{'='*60}")
-    logging.info(f"Running: {scraper.source_name}")
-    logging.info(f"{'='*60}")
+    logging.info(f"SUMMARY: {count} articles scraped")
+    logging.info(f"{'='*60}\n")
+
+    return count
+
+
+def run_daemon(source_name: str = None, **run_options):
+    """
+    Poll sources until SIGINT/SIGTERM, each on its own adaptive interval
+    Scraper instances (HTTP sessions, enrichment event loops, robots and
+    HTTP caches) stay warm between polls; each is closed by its own polling
+    thread when that stops. On the first signal no new polls start and
+    in-flight ones stop taking articles, then write and commit those they
+    have; a second signal exits immediately
+    """
+    if source_name:
+        source_key = source_name.lower()
+        if not has_source(source_key):
+            logging.error(f"Unknown source: {source_name}")
+            logging.info(f"Available sources: {', '.join(available_sources())}")
+            return 0
+        source_keys = [source_key]
+    else:
+        source_keys = available_sources()
+
+    scrapers = create_scrapers(source_keys)
+
+    stop_event = threading.Event()
+
+    def handle_signal(signum, frame):
+        if stop_event.is_set():
+            logging.warning("Second signal received, exiting without waiting")
+            sys.exit(1)
+        logging.info(f"Received {signal.Signals(signum).name}, finishing in-flight polls...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    totals = {key: 0 for key in scrapers}
+
+    def make_poll(key, scraper):
+        def poll() -> int:
+            try:
+                count = run_scraper(scraper, stop_event=stop_event, **run_options)
+            finally:
+                # Keep the textfile fresh for scrapes between polls
+                metrics.export()
+            totals[key] += count
+            return count
+        return poll
+
+    loops = [
+        SourceLoop(
+            key,
+            make_poll(key, scraper),
+            AdaptiveInterval(SOURCES.get(key, {}).get("poll_interval", DAEMON_DEFAULT_INTERVAL)),
+            stop_event,
+            on_exit=scraper.close
+        )
+        for key, scraper in scrapers.items()
+    ]
 
-    articles = scraper.run()
+    for loop in loops:
+        loop.start()
+    logging.info(f"Daemon started: {', '.join(scrapers)} (Ctrl+C to stop)")
 
+    # Short joins keep the main thread responsive to signals
+    while not stop_event.is_set() and any(loop.is_alive() for loop in loops):
+        for loop in loops:
+            loop.join(timeout=1)
+
+    deadline = time.monotonic() + DAEMON_SHUTDOWN_TIMEOUT
+    for loop in loops:
+        loop.join(timeout=max(0, deadline - time.monotonic()))
+        if loop.is_alive():
+            logging.warning(f"{loop.source} still running after {DAEMON_SHUTDOWN_TIMEOUT:.0f}s, abandoning it")
+
+    total_articles = sum(totals.values())
     logging.info(f"\n{'='*60}")
-    logging.info(f"SUMMARY: {len(articles)} articles scraped")
+    logging.info(f"SUMMARY: {total_articles} articles scraped while running")
     logging.info(f"{'='*60}\n")
 
-    return len(articles)
+    return total_articles
 
 
 def main():
@@ -132,7 +246,7 @@ def main():
     parser.add_argument(
         "--source",
         type=str,
-        help="Run specific scraper (g1, folha, estadao)"
+        help="Run specific scraper (g1, folha, estadao, or any other SOURCES key)"
     )
 
     parser.add_argument(
@@ -141,6 +255,66 @@ def main():
         help="Force Data-Lite mode (ignore images)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Number of sources to scrape in parallel (default: up to {MAX_SOURCE_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--full-text",
+        action="store_true",
+        help="Fetch each article page to fill in full text (slower)"
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help=f"Processes parsing article pages during --full-text; 0 parses in the scraper thread (default: {PARSE_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Emit every article, including ones already seen in earlier runs"
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson"],
+        default=OUTPUT_FORMAT,
+        help="Output format: one JSON file per run, or streamed NDJSON (default: %(default)s)"
+    )
+
+    parser.add_argument(
+        "--ingest",
+        action="store_true",
+        help="Bulk-insert scraped articles into DATABASE_URL (or Supabase)"
+    )
+
+    parser.add_argument(
+        "--push",
+        action="store_true",
+        help="POST articles to BACKEND_API_URL in gzip batches as they are extracted"
+    )
+
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and poll each source on an adaptive interval until stopped"
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="full",
+        choices=["full", "sample"],
+        default=None,
+        help="Profile each source's run: full (cProfile + tracemalloc, one run at a time, article pages parsed inline) or sample (low overhead); reports in logs/profiles/"
+    )
+
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -149,6 +323,8 @@ def main():
 
     args = parser.parse_args()
 
+    ensure_dirs()
+
     # Setup logging
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -161,15 +337,54 @@ def main():
         config.DATA_LITE_MODE = True
         logging.info("Data-Lite Mode: FORCED ON")
 
+    if args.parse_workers is not None:
+        parse_pool.configure(args.parse_workers)
+
+    # Profiling mode (PROFILE_MODE from the environment unless given here)
+    profiler.configure(args.profile or PROFILE_MODE)
+    if profiler.mode == "full":
+        # cProfile only sees the run's thread, so keep parsing on it
+        if parse_pool.enabled:
+            logging.info("Profiling: parse workers disabled so cProfile sees article parsing")
+            parse_pool.configure(0)
+        logging.info("Profiling: full (cProfile + tracemalloc), source runs are serialized")
+    elif profiler.mode == "sample":
+        logging.info(f"Profiling: sampling stacks every {profiler.sample_interval * 1000:.0f}ms")
+
+    # Metrics files per kind of process, so concurrent ones don't overwrite each other
+    metrics.set_scope(f"{'daemon-' if args.daemon else ''}{args.source or 'all'}")
+
     logging.info("🇧🇷 Espectro News Scrapers")
     logging.info(f"Data-Lite Mode: {'ON' if DATA_LITE_MODE else 'OFF'}")
     logging.info("")
 
+    run_options = {
+        "enrich": args.full_text or ENRICH_FULL_TEXT,
+        "incremental": INCREMENTAL_CRAWL and not args.all,
+        "output_format": args.format,
+        "ingest": args.ingest or DB_INGEST_ENABLED,
+        "push": args.push or PUSH_ENABLED
+    }
+
     # Run scrapers
-    if args.source:
-        run_single_scraper(args.source)
+    if args.daemon:
+        if not run_options["incremental"]:
+            logging.warning("Daemon mode without incremental crawl re-emits every article on every poll")
+        run_daemon(args.source, **run_options)
+    elif args.source:
+        run_single_scraper(args.source, **run_options)
     else:
-        run_all_scrapers()
+        run_all_scrapers(max_workers=args.workers, **run_options)
+
+    # Wait for in-flight pushes; anything unsent stays spooled for the next run
+    if run_options["push"]:
+        from utils.push_sink import push_sink
+        push_sink.close()
+
+    parse_pool.close()
+
+    # Per-stage timings, bytes, HTTP statuses and retries for this run
+    metrics.export()
 
 
 if __name__ == "__main__":
@@ -3,29 +3,82 @@ Base Scraper Class
 All Brazilian news scrapers inherit from this
 """
 
-import json
+import asyncio
 import logging
+import threading
+import time
 from datetime import datetime
-from pathlib import Path
-from typing import List, Dict, Optional
+from itertools import islice
+from json.encoder import encode_basestring
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Dict, Optional
 from abc import ABC, abstractmethod
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from config import (
     USER_AGENT, REQUEST_TIMEOUT, MAX_RETRIES,
-    OUTPUT_DIR, DATA_LITE_MODE
+    DATA_LITE_MODE, HTTP_CACHE_ENABLED,
+    ENRICH_FULL_TEXT, ENRICH_CONCURRENCY,
+    USE_RSS_FEEDS, FEED_MAX_ITEMS, INCREMENTAL_CRAWL, OUTPUT_FORMAT,
+    ARTICLE_STORE_ENABLED, NEAR_DUP_DETECTION, STORY_CLUSTERING, DB_INGEST_ENABLED,
+    PUSH_ENABLED
 )
 from utils.robots_checker import check_url_allowed, wait_for_rate_limit
+from utils.metrics import metrics
+from utils.http_cache import FetchResult, http_cache
+from utils.feed_parser import chunked, iter_feed_entries
+from utils.html_parsing import declared_encoding, parse_html
+from utils.json_writer import JsonWriter
+from utils.ndjson_writer import NdjsonWriter
+from utils.pipeline import CommitStage, DedupStage, EnrichStage, Pipeline, WriteStage
+from utils.url_canonical import canonicalize_url
+from utils.retry_policy import circuit_breaker, next_retry_delay
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+    from utils.async_fetcher import AsyncFetcher
 
 logger = logging.getLogger(__name__)
 
 
+# Field order matches to_dict(); filled in one allocation by Article.to_json
+ARTICLE_JSON_TEMPLATE = (
+    '{"title":%s,"url":%s,"snippet":%s,"source_name":%s,"published_at":%s,'
+    '"image_url":%s,"author":%s,"full_text":%s,"cluster_key":%s}'
+)
+
+
+def _json_value(value: Optional[str]) -> str:
+    """
+    Encode an optional string as a JSON token (same output as json.dumps
+    with ensure_ascii=False)
+    """
+    return "null" if value is None else encode_basestring(value)
+
+
+def local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Convert a timezone-aware datetime to naive local time, the convention
+    datetime.now() gives every other timestamp, so one output never mixes both
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
 class Article:
     """
     Structured article data
+    Slotted: no per-instance __dict__, which matters with thousands of
+    full-text articles held in a batch
     """
+    __slots__ = (
+        "title", "url", "snippet", "source_name",
+        "published_at", "image_url", "author", "full_text", "cluster_key"
+    )
+
     def __init__(
         self,
         title: str,
@@ -35,16 +88,18 @@ class Article:
         published_at: Optional[datetime] = None,
         image_url: Optional[str] = None,
         author: Optional[str] = None,
-        full_text: Optional[str] = None
+        full_text: Optional[str] = None,
+        cluster_key: Optional[str] = None
     ):
         self.title = title
         self.url = url
         self.snippet = snippet
         self.source_name = source_name
-        self.published_at = published_at or datetime.now()
+        self.published_at = local_naive(published_at)  # None when the source gave no date
         self.image_url = image_url if not DATA_LITE_MODE else None
         self.author = author
         self.full_text = full_text
+        self.cluster_key = cluster_key  # story cluster, set by the clustering stage
 
     def to_dict(self) -> Dict:
         """
@@ -55,12 +110,30 @@ class Article:
             "url": self.url,
             "snippet": self.snippet,
             "source_name": self.source_name,
-            "published_at": self.published_at.isoformat(),
+            "published_at": self.published_at.isoformat() if self.published_at else None,
             "image_url": self.image_url,
             "author": self.author,
-            "full_text": self.full_text
+            "full_text": self.full_text,
+            "cluster_key": self.cluster_key
         }
 
+    def to_json(self) -> str:
+        """
+        Compact JSON object for this article, built without an intermediate dict
+        Equivalent to json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        """
+        return ARTICLE_JSON_TEMPLATE % (
+            _json_value(self.title),
+            _json_value(self.url),
+            _json_value(self.snippet),
+            _json_value(self.source_name),
+            _json_value(self.published_at.isoformat() if self.published_at else None),
+            _json_value(self.image_url),
+            _json_value(self.author),
+            _json_value(self.full_text),
+            _json_value(self.cluster_key)
+        )
+
 
 class BaseScraper(ABC):
     """
@@ -68,17 +141,79 @@ class BaseScraper(ABC):
     Handles robots.txt, rate limiting, and data persistence
     """
 
-    def __init__(self, source_name: str, base_url: str):
+    def __init__(
+        self,
+        source_name: str,
+        base_url: str,
+        rss_url: Optional[str] = None,
+        fetcher: Optional["AsyncFetcher"] = None
+    ):
         self.source_name = source_name
+        self.source_key: Optional[str] = None  # SOURCES key, set by the registry
         self.base_url = base_url
+        self.rss_url = rss_url
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": USER_AGENT})
-        self.articles: List[Article] = []
+        self._fetcher = fetcher
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.http_cache = http_cache if HTTP_CACHE_ENABLED else None
+        self._held_pages: List[str] = []  # Listing URLs whose cache entry waits for the commit
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    @property
+    def fetcher(self) -> "AsyncFetcher":
         """
-        Fetch and parse a web page with robots.txt compliance
+        The injected AsyncFetcher, else the shared one
+        Resolved on first use so runs without enrichment never import aiohttp
+        """
+        if self._fetcher is None:
+            from utils.async_fetcher import async_fetcher
+            self._fetcher = async_fetcher
+        return self._fetcher
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
         """
+        The scraper's enrichment event loop, created on first use
+        Kept between runs, with the fetcher's session bound to it, so
+        daemon polls reuse warm connections; released by close()
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    def close(self):
+        """
+        Close the enrichment loop, its fetcher session and the HTTP session
+        Call from the scraper's thread once it will not run again
+        """
+        loop, self._loop = self._loop, None
+        if loop is not None and not loop.is_closed():
+            try:
+                if self._fetcher is not None:
+                    loop.run_until_complete(self._fetcher.close())
+            finally:
+                loop.close()
+
+        self.session.close()
+
+    def parse_html(self, content: bytes, content_type: Optional[str] = None) -> "BeautifulSoup":
+        """
+        Parse raw HTML bytes into a soup, for scrapers written against
+        BeautifulSoup (SpecScraper overrides this with an lxml parse)
+        The declared charset is used instead of detection
+        """
+        return parse_html(content, declared_encoding(content, content_type))
+
+    def fetch_content(self, url: str, hold: bool = False) -> Optional[FetchResult]:
+        """
+        Download a web page with robots.txt compliance
+        Sends conditional-GET validators when the HTTP cache is enabled;
+        with hold=True a changed page is only cached by commit_fetched()
+        """
+        # Fail fast while the domain's circuit is open
+        if not circuit_breaker.allow(url):
+            logger.warning(f"Skipping {url} - circuit open for its domain")
+            return None
+
         # Check robots.txt
         if not check_url_allowed(url):
             logger.warning(f"Skipping {url} - blocked by robots.txt")
@@ -87,43 +222,363 @@ class BaseScraper(ABC):
         # Enforce rate limiting
         wait_for_rate_limit(url)
 
-        # Fetch with retries
+        # Fetch with retries (backoff with jitter, honouring Retry-After)
         for attempt in range(MAX_RETRIES):
             try:
                 logger.debug(f"Fetching {url} (attempt {attempt + 1}/{MAX_RETRIES})")
 
-                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+                headers = self.http_cache.conditional_headers(url) if self.http_cache else {}
+
+                with metrics.stage("network"):
+                    response = self.session.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
+                metrics.record_response(response.status_code, len(response.content))
+
                 response.raise_for_status()
+                circuit_breaker.record_success(url)
+
+                if self.http_cache is None:
+                    return FetchResult(response.content, False, response.headers.get("Content-Type"))
 
-                # Parse HTML
-                soup = BeautifulSoup(response.content, "lxml")
-                return soup
+                result = self.http_cache.resolve(
+                    url, response.status_code, response.headers, response.content, hold=hold
+                )
+                if result is not None:
+                    if hold:
+                        self._held_pages.append(url)
+                    return result
+                # Cached body vanished under a 304 - retry unconditionally
 
             except requests.exceptions.RequestException as e:
                 logger.error(f"Error fetching {url}: {e}")
 
-                if attempt == MAX_RETRIES - 1:
-                    logger.error(f"Failed to fetch {url} after {MAX_RETRIES} attempts")
+                error_response = e.response
+                if error_response is None:
+                    metrics.record_response(None)
+
+                delay = next_retry_delay(
+                    url,
+                    attempt,
+                    status=error_response.status_code if error_response is not None else None,
+                    retry_after=error_response.headers.get("Retry-After") if error_response is not None else None
+                )
+
+                if delay is None:
+                    logger.error(f"Failed to fetch {url} after {attempt + 1} attempts")
                     return None
 
+                logger.info(f"Retrying {url} in {delay:.1f}s")
+                metrics.record_retry()
+                time.sleep(delay)
+                metrics.add_time("backoff", delay)
+
         return None
 
+    def _parse_result(
+        self,
+        url: str,
+        result: Optional[FetchResult],
+        skip_unchanged: bool
+    ) -> Optional["BeautifulSoup"]:
+        """
+        Parse a fetched body unless it is unchanged and the caller opted out
+        """
+        if result is None:
+            return None
+
+        if skip_unchanged and result.unchanged:
+            logger.info(f"Unchanged since last fetch, skipping parse: {url}")
+            return None
+
+        with metrics.stage("parse"):
+            return self.parse_html(result.content, result.content_type)
+
+    def fetch_page(
+        self,
+        url: str,
+        skip_unchanged: bool = False,
+        hold: bool = False
+    ) -> Optional["BeautifulSoup"]:
+        """
+        Fetch and parse a web page with robots.txt compliance
+        With skip_unchanged=True, returns None when the page has not changed
+        """
+        return self._parse_result(url, self.fetch_content(url, hold), skip_unchanged)
+
+    def commit_fetched(self, completed: bool):
+        """
+        Cache the listing pages held since the last call, once their
+        articles are committed; after a failed run they are dropped, so
+        the next run does not see them as unchanged
+        """
+        urls, self._held_pages = self._held_pages, []
+        if self.http_cache is None:
+            return
+
+        for url in urls:
+            if completed:
+                self.http_cache.commit(url)
+            else:
+                self.http_cache.release(url)
+
     @abstractmethod
-    def scrape_homepage(self) -> List[Article]:
+    def parse_homepage(self, soup: "BeautifulSoup") -> List[Article]:
         """
-        Scrape articles from the homepage
+        Extract articles from a parsed homepage
         Must be implemented by each source-specific scraper
         """
         pass
 
+    def iter_homepage_articles(self, soup: "BeautifulSoup") -> Iterator[Article]:
+        """
+        Articles of a parsed homepage, one at a time
+        Scrapers that can extract lazily override this; the default walks
+        parse_homepage's list
+        """
+        return iter(self.parse_homepage(soup))
+
     @abstractmethod
-    def scrape_article_details(self, article_url: str) -> Optional[Article]:
+    def parse_article_details(self, soup: "BeautifulSoup", article_url: str) -> Optional[Article]:
         """
-        Scrape full article content
+        Extract full article content from a parsed article page
         Must be implemented by each source-specific scraper
         """
         pass
 
+    def iter_homepage(self, skip_unchanged: bool = True) -> Iterator[Article]:
+        """
+        Scrape articles from the homepage, yielding each as it is extracted
+        With skip_unchanged=True, yields nothing when the homepage is
+        unchanged since the last committed run
+        """
+        soup = self.fetch_page(self.base_url, skip_unchanged=skip_unchanged, hold=True)
+        if soup is None:
+            return
+
+        yield from metrics.timed("extract", self.iter_homepage_articles(soup))
+
+    def scrape_homepage(self) -> List[Article]:
+        """
+        Scrape articles from the homepage (list form of iter_homepage)
+        """
+        return list(self.iter_homepage())
+
+    def iter_feed_articles(self, content: bytes) -> Iterator[Article]:
+        """
+        Build articles from a buffered RSS/Atom feed body, parsed incrementally
+        """
+        for entry in islice(iter_feed_entries(chunked(content)), FEED_MAX_ITEMS):
+            yield Article(
+                title=entry["title"],
+                url=entry["url"],
+                snippet=self.extract_snippet(entry["summary"]) if entry["summary"] else self.extract_snippet(entry["title"]),
+                source_name=self.source_name,
+                published_at=entry["published_at"] or datetime.now(),
+                image_url=entry["image_url"],
+                author=entry["author"]
+            )
+
+    def iter_feed(self, skip_unchanged: bool = True) -> Optional[Iterator[Article]]:
+        """
+        Scrape articles from the source's RSS/Atom feed, lazily
+        Returns None when the feed is unusable (missing, unreachable, or
+        without a usable first item) so the caller can fall back to the
+        HTML homepage; with skip_unchanged=True an unchanged feed yields
+        nothing, like an unchanged homepage. A parse error after the first
+        item ends the feed there
+        """
+        if not self.rss_url:
+            return None
+
+        result = self.fetch_content(self.rss_url, hold=True)
+        if result is None:
+            return None
+
+        if result.unchanged and skip_unchanged:
+            logger.info(f"Unchanged since last fetch, skipping parse: {self.rss_url}")
+            return iter(())
+
+        articles = metrics.timed("parse", self.iter_feed_articles(result.content))
+        try:
+            first = next(articles, None)
+        except etree.LxmlError as e:
+            logger.error(f"Error parsing feed {self.rss_url}: {e}")
+            return None
+
+        if first is None:
+            logger.warning(f"Feed {self.rss_url} had no usable items")
+            return None
+
+        return self._rest_of_feed(first, articles)
+
+    def _rest_of_feed(self, first: Article, articles: Iterator[Article]) -> Iterator[Article]:
+        yield first
+        try:
+            yield from articles
+        except etree.LxmlError as e:
+            logger.error(f"Error parsing feed {self.rss_url}, keeping the items before it: {e}")
+
+    def iter_latest(self, skip_unchanged: bool = True) -> Iterator[Article]:
+        """
+        Scrape the latest articles lazily: feed first, HTML homepage as fallback
+        URLs are canonicalized and repeats dropped
+        """
+        articles = None
+
+        if USE_RSS_FEEDS and self.rss_url:
+            articles = self.iter_feed(skip_unchanged)
+            if articles is None:
+                logger.warning(f"Falling back to homepage scraping for {self.source_name}")
+
+        if articles is None:
+            articles = self.iter_homepage(skip_unchanged)
+
+        yield from self.iter_canonical(articles)
+
+    def scrape_latest(self) -> List[Article]:
+        """
+        List form of iter_latest
+        """
+        return list(self.iter_latest())
+
+    @staticmethod
+    def iter_canonical(articles: Iterable[Article]) -> Iterator[Article]:
+        """
+        Rewrite article URLs to canonical form, keeping the first of each
+        """
+        seen_urls = set()
+
+        for article in articles:
+            article.url = canonicalize_url(article.url)
+            if article.url in seen_urls:
+                continue
+            seen_urls.add(article.url)
+            yield article
+
+    def scrape_article_details(self, article_url: str) -> Optional[Article]:
+        """
+        Scrape full article content
+        """
+        soup = self.fetch_page(article_url)
+        if soup is None:
+            return None
+
+        with metrics.stage("extract"):
+            return self.parse_article_details(soup, article_url)
+
+    async def parse_article_async(self, article_url: str, result: Optional[FetchResult]) -> Optional[Article]:
+        """
+        Parse a fetched article page (inline; SpecScraper can use the parse pool)
+        A page that fails to parse is logged and skipped
+        """
+        if result is None:
+            return None
+
+        try:
+            soup = self._parse_result(article_url, result, False)
+            if soup is None:
+                return None
+
+            with metrics.stage("extract"):
+                return self.parse_article_details(soup, article_url)
+
+        except Exception as e:
+            logger.error(f"Error parsing {self.source_name} article {article_url}: {e}")
+            return None
+
+    def merge_details(self, article: Article, details: Article):
+        """
+        Copy detail-page fields onto a homepage article
+        Homepage title and URL are kept; anything the detail page adds wins
+        (a detail page without a date keeps the feed/homepage one)
+        """
+        article.full_text = details.full_text or article.full_text
+        article.author = details.author or article.author
+        article.published_at = details.published_at or article.published_at
+        article.image_url = details.image_url or article.image_url
+
+        # Homepage snippet falls back to the title when there is no summary
+        if details.snippet and article.snippet == article.title:
+            article.snippet = details.snippet
+
+    async def _enrich_one(self, article: Article, semaphore: asyncio.Semaphore) -> bool:
+        """
+        Fetch, parse and merge one detail page; True if it was enriched
+        """
+        # The fetch slot is freed before parsing, so fetches continue while
+        # pages wait for (or run on) the parse workers
+        async with semaphore:
+            result = await self.fetcher.fetch(article.url)
+        details = await self.parse_article_async(article.url, result)
+
+        if details is None:
+            return False
+
+        self.merge_details(article, details)
+        return True
+
+    def iter_enriched(self, articles: Iterable[Article], concurrency: int = ENRICH_CONCURRENCY) -> Iterator[Article]:
+        """
+        Enrich a stream of articles, yielding each one (enriched or not) as
+        soon as its detail page is done
+        Runs on the scraper's event loop, advanced only while waiting for
+        results. At most 2 x concurrency articles are taken from upstream at a time
+        (`concurrency` fetching, the rest parsing); if upstream fails, those
+        already taken are finished and yielded before the error is re-raised
+        """
+        loop = self._event_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        window = 2 * concurrency
+        upstream = iter(articles)
+        pending = set()
+        error = None
+        taken = enriched = 0
+        start = time.perf_counter()
+
+        async def enrich_one(article: Article):
+            return article, await self._enrich_one(article, semaphore)
+
+        try:
+            while True:
+                while upstream is not None and len(pending) < window:
+                    try:
+                        article = next(upstream)
+                    except StopIteration:
+                        upstream = None
+                        break
+                    except Exception as e:
+                        error, upstream = e, None
+                        break
+                    pending.add(loop.create_task(enrich_one(article)))
+                    taken += 1
+
+                if not pending:
+                    break
+
+                done, pending = loop.run_until_complete(
+                    asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                )
+                for task in done:
+                    article, ok = task.result()
+                    enriched += ok
+                    yield article
+
+            if error is not None:
+                raise error
+
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+            if taken:
+                elapsed = time.perf_counter() - start
+                rate = enriched / elapsed if elapsed > 0 else 0.0
+                logger.info(
+                    f"[OK] Enriched {enriched}/{taken} {self.source_name} articles "
+                    f"in {elapsed:.1f}s ({rate:.2f} articles/s)"
+                )
+
     def extract_snippet(self, text: str, max_length: int = 280) -> str:
         """
         Extract a snippet (2-sentence summary) from text
@@ -137,47 +592,105 @@ class BaseScraper(ABC):
 
         return snippet
 
-    def save_to_json(self) -> Path:
+    def build_pipeline(
+        self,
+        enrich: bool = ENRICH_FULL_TEXT,
+        incremental: bool = INCREMENTAL_CRAWL,
+        output_format: str = OUTPUT_FORMAT,
+        near_dedup: bool = NEAR_DUP_DETECTION,
+        cluster: bool = STORY_CLUSTERING,
+        ingest: bool = DB_INGEST_ENABLED,
+        push: bool = PUSH_ENABLED
+    ) -> Pipeline:
         """
-        Save scraped articles to JSON file
+        Stages run() streams articles through (same options as run)
+        Override to add, drop or reorder stages for a source
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.source_name.lower().replace(' ', '_')}_{timestamp}.json"
-        filepath = OUTPUT_DIR / filename
-
-        data = {
-            "source": self.source_name,
-            "scraped_at": datetime.now().isoformat(),
-            "article_count": len(self.articles),
-            "data_lite_mode": DATA_LITE_MODE,
-            "articles": [article.to_dict() for article in self.articles]
-        }
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-        logger.info(f"[OK] Saved {len(self.articles)} articles to {filepath}")
-        return filepath
+        dedup = DedupStage(self.source_name, incremental, near_dedup, cluster)
+        stages = [dedup]
+
+        if enrich:
+            stages.append(EnrichStage(self))
+
+        # Streamed as each article is finished
+        writer = NdjsonWriter(self.source_name) if output_format == "ndjson" else JsonWriter(self.source_name)
+        stages.append(WriteStage(writer.write, writer.close))
+        if push:
+            from utils.push_sink import push_sink
+            stages.append(WriteStage(push_sink.write, lambda completed: push_sink.flush()))
+
+        # Batched, and only then recorded as seen
+        handlers = []
+        if ARTICLE_STORE_ENABLED:
+            from utils.article_store import article_store
+            handlers.append(article_store.insert_articles)
+        if ingest:
+            from utils.db_ingest import db_ingester
+            handlers.append(db_ingester.ingest_articles)
+        handlers.append(dedup.record)
+
+        def finish(completed: bool):
+            dedup.release(completed)
+            self.commit_fetched(completed)
+
+        stages.append(CommitStage(handlers, finish=finish))
+
+        return Pipeline(stages)
+
+    def stream(self, stop_event: Optional[threading.Event] = None, **run_options) -> Iterator[Article]:
+        """
+        Scrape and yield each article once it has been through every stage
+        (run_options as for run); stopping early still closes the sinks
+        Unchanged listing pages are only skipped by incremental runs: a full
+        run re-emits their articles
+        """
+        skip_unchanged = run_options.get("incremental", INCREMENTAL_CRAWL)
+        return self.build_pipeline(**run_options).stream(self.iter_latest(skip_unchanged), stop_event)
 
-    def run(self) -> List[Article]:
+    def run(
+        self,
+        enrich: bool = ENRICH_FULL_TEXT,
+        incremental: bool = INCREMENTAL_CRAWL,
+        output_format: str = OUTPUT_FORMAT,
+        near_dedup: bool = NEAR_DUP_DETECTION,
+        cluster: bool = STORY_CLUSTERING,
+        ingest: bool = DB_INGEST_ENABLED,
+        push: bool = PUSH_ENABLED,
+        stop_event: Optional[threading.Event] = None
+    ) -> int:
         """
-        Main execution method
+        Main execution method: stream the latest articles to the sinks
+        With enrich=True, detail pages are fetched to fill in full_text;
+        with incremental=True, only articles unseen in earlier runs are emitted;
+        with near_dedup=True, near-copies of recent articles from any source are dropped;
+        with cluster=True, each article gets the cluster_key of its story;
+        with ingest=True, articles are also bulk-inserted into the backend database;
+        with push=True, articles are POSTed to the backend API as they are extracted;
+        output_format is "json" (one file per run) or "ndjson" (rotating parts);
+        once stop_event is set, no new articles are taken and the sinks close.
+        If the run fails or stops partway, the articles that got through are
+        still written and committed. Returns the number of articles written
         """
         logger.info(f"Starting scraper for {self.source_name}")
         logger.info(f"Data-Lite Mode: {'ON' if DATA_LITE_MODE else 'OFF'}")
 
-        try:
-            # Scrape homepage
-            self.articles = self.scrape_homepage()
-
-            logger.info(f"[OK] Scraped {len(self.articles)} articles from {self.source_name}")
+        written = 0
 
-            # Save to JSON
-            if self.articles:
-                self.save_to_json()
-
-            return self.articles
-
-        except Exception as e:
-            logger.error(f"Error in scraper for {self.source_name}: {e}", exc_info=True)
-            return []
+        with metrics.run(self.source_name) as run_record:
+            try:
+                for _ in self.stream(
+                    enrich=enrich, incremental=incremental, output_format=output_format,
+                    near_dedup=near_dedup, cluster=cluster, ingest=ingest, push=push,
+                    stop_event=stop_event
+                ):
+                    written += 1
+
+            except Exception as e:
+                logger.error(
+                    f"Error in scraper for {self.source_name} after {written} articles: {e}",
+                    exc_info=True
+                )
+                run_record.failed = True
+
+            run_record.articles = written
+            return written
@@ -0,0 +1,96 @@
+"""
+Scraper Registry - Source key -> scraper class, imported on demand
+Built-in sources come from config.SOURCES: an "extract" spec runs on
+SpecScraper, a "scraper" entry ("module:Class") names a custom class.
+Installed packages can add more through the "espectro.scrapers" entry
+point group. A scraper module (and bs4, requests, lxml with it) is only
+imported when that source is actually run
+"""
+
+import importlib
+import logging
+import time
+from typing import Dict, List, Optional
+
+from config import SOURCES
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "espectro.scrapers"
+SPEC_SCRAPER = "scrapers.spec_scraper:SpecScraper"
+
+# Entry points are scanned once, and only for a key missing from SOURCES or a full listing
+_entry_points: Optional[Dict[str, str]] = None
+
+
+def _plugin_paths() -> Dict[str, str]:
+    global _entry_points
+
+    if _entry_points is None:
+        from importlib.metadata import entry_points
+        _entry_points = {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
+    return _entry_points
+
+
+def scraper_path(source_key: str) -> str:
+    """
+    "module:Class" import path for a source key; KeyError if unknown
+    """
+    source = SOURCES.get(source_key)
+    if source and source.get("scraper"):
+        return source["scraper"]
+    if source and source.get("extract"):
+        return SPEC_SCRAPER
+
+    return _plugin_paths()[source_key]
+
+
+def has_source(source_key: str) -> bool:
+    try:
+        scraper_path(source_key)
+    except KeyError:
+        return False
+    return True
+
+
+def available_sources() -> List[str]:
+    """
+    Every runnable source key: config order first, then plugins
+    """
+    keys = [key for key, source in SOURCES.items() if source.get("scraper") or source.get("extract")]
+    keys += sorted(key for key in _plugin_paths() if key not in keys)
+    return keys
+
+
+def load_scraper_class(source_key: str) -> type:
+    """
+    Import a source's scraper module and return its class
+    """
+    module_name, _, class_name = scraper_path(source_key).partition(":")
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    logger.debug(f"Imported {module_name} in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    return getattr(module, class_name)
+
+
+def create_scraper(source_key: str):
+    """
+    Construct the scraper for one source key
+    SpecScraper is told which source it is; custom classes know already
+    """
+    scraper_class = load_scraper_class(source_key)
+    if scraper_path(source_key) == SPEC_SCRAPER:
+        return scraper_class(source_key)
+
+    scraper = scraper_class()
+    scraper.source_key = source_key  # lets parse workers rebuild it
+    return scraper
+
+
+def create_scrapers(source_keys: List[str]) -> Dict:
+    """
+    Construct scrapers for the given keys, in order
+    """
+    return {key: create_scraper(key) for key in source_keys}
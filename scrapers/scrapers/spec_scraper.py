@@ -0,0 +1,171 @@
+"""
+Spec-Driven Scraper
+Scrapes any source whose config.SOURCES entry has an "extract" spec:
+pages are parsed once with lxml and read with the compiled rules from
+utils.extraction, so a new outlet is a config entry, not a module
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+from lxml import etree
+
+from scrapers.base_scraper import BaseScraper, Article
+from utils.extraction import ExtractionRules
+from utils.html_parsing import parse_document
+from utils.http_cache import FetchResult
+from utils.metrics import metrics
+from utils.parse_pool import parse_pool
+
+logger = logging.getLogger(__name__)
+
+
+def parse_datetime(value: Optional[str], formats: List[str]) -> Optional[datetime]:
+    """
+    ISO 8601 first, then each strptime format in turn
+    """
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+
+    for date_format in formats:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+
+    return None
+
+
+class SpecScraper(BaseScraper):
+    """
+    Scraper driven by SOURCES[source_key]["extract"]
+    parse_html returns an lxml document instead of a BeautifulSoup
+    """
+
+    def __init__(self, source_key: str):
+        source = SOURCES[source_key]
+
+        super().__init__(
+            source_name=source["name"],
+            base_url=source["url"],
+            rss_url=source.get("rss")
+        )
+        self.source_key = source_key
+        self.rules = ExtractionRules(source["extract"])
+
+    def parse_html(self, content: bytes, content_type: Optional[str] = None):
+        """
+        Parse raw HTML bytes into an lxml document
+        """
+        try:
+            return parse_document(content, content_type)
+        except (etree.ParserError, ValueError) as e:
+            logger.error(f"Could not parse {self.source_name} page: {e}")
+            return None
+
+    def parse_homepage(self, root) -> List[Article]:
+        """
+        Extract top stories with the compiled homepage rules
+        """
+        return list(self.iter_homepage_articles(root))
+
+    def iter_homepage_articles(self, root) -> Iterator[Article]:
+        """
+        Yield top stories one at a time, in page order
+        """
+        rules = self.rules.homepage
+        if rules is None:
+            logger.warning(f"No homepage extraction rules for {self.source_name}")
+            return
+
+        containers = rules.find_containers(root)
+        logger.info(f"Found {len(containers)} article candidates on {self.source_name} homepage")
+
+        seen_urls = set()
+
+        for container in containers:
+            fields = rules.extract(container, with_image=not DATA_LITE_MODE)
+            if fields is None:
+                continue
+
+            url = urljoin(self.base_url, fields["url"])
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            logger.debug(f"✓ Scraped: {fields['title'][:60]}...")
+            yield Article(
+                title=fields["title"],
+                url=url,
+                snippet=fields["snippet"] or self.extract_snippet(fields["title"]),
+                source_name=self.source_name,
+                image_url=fields["image_url"],
+                published_at=datetime.now()  # homepages don't show publish dates
+            )
+
+    def parse_article_details(self, root, article_url: str) -> Optional[Article]:
+        """
+        Extract full article content with the compiled article rules
+        Behind a paywall the snippet stands in for the full text
+        """
+        rules = self.rules.article
+        if rules is None:
+            return None
+
+        return self.article_from_fields(rules.extract(root, with_image=not DATA_LITE_MODE), article_url)
+
+    def article_from_fields(self, fields: Dict, article_url: str) -> Article:
+        """
+        Build the detail Article from ArticleRules.extract fields
+        """
+        snippet = fields["snippet"] or ""
+        full_text = fields["full_text"]
+
+        if fields["paywalled"]:
+            logger.warning(f"Paywall detected on {article_url}")
+            full_text = snippet
+
+        return Article(
+            title=fields["title"],
+            url=article_url,
+            snippet=snippet or self.extract_snippet(full_text),
+            source_name=self.source_name,
+            published_at=parse_datetime(fields["published_at"], self.rules.article.time_formats),  # None if undated
+            image_url=fields["image_url"],
+            author=fields["author"],
+            full_text=full_text
+        )
+
+    async def parse_article_async(self, article_url: str, result: Optional[FetchResult]) -> Optional[Article]:
+        """
+        Parse a fetched article page, on the parse pool when it is enabled
+        Workers only parse and extract the fields (with this process's
+        data-lite setting); the Article is built here
+        """
+        if result is None or not parse_pool.enabled or self.rules.article is None:
+            return await super().parse_article_async(article_url, result)
+
+        try:
+            with metrics.stage("parse"):
+                fields = await parse_pool.extract_article(self.source_key, result, with_image=not DATA_LITE_MODE)
+        except Exception as e:
+            logger.error(f"Error parsing {self.source_name} article {article_url}: {e}")
+            return None
+
+        if fields is None:
+            logger.error(f"Could not parse {self.source_name} page: {article_url}")
+            return None
+
+        with metrics.stage("extract"):
+            return self.article_from_fields(fields, article_url)
+
+
+# Import DATA_LITE_MODE at the end to avoid circular import
+from config import DATA_LITE_MODE, SOURCES
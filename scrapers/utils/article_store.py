@@ -0,0 +1,190 @@
+"""
+Article Store - Indexed local SQLite store of scraped articles
+Every run bulk-inserts its articles here, so lookups by URL, source or
+publish date no longer mean opening every JSON file in output/
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from config import ARTICLE_STORE_DB
+from utils.local_db import LazyDb
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ["url", "title", "snippet", "source_name", "published_at", "image_url", "author", "full_text", "scraped_at", "cluster_key"]
+
+
+def normalize_timestamp(value) -> Optional[str]:
+    """
+    ISO 8601 in UTC, so stored timestamps sort and compare as strings
+    Naive datetimes (and naive ISO strings) are taken as local time
+    """
+    if value is None or value == "":
+        return None
+
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    return value.astimezone(timezone.utc).isoformat()
+
+
+class ArticleStore(LazyDb):
+    """
+    SQLite (WAL) article table with indexes on url, source_name and published_at
+    Re-inserting a URL updates it in place; full text is never overwritten
+    with null
+    """
+
+    def __init__(self, db_path: Path = ARTICLE_STORE_DB, read_only: bool = False):
+        super().__init__(db_path, read_only)
+        self.lock = threading.Lock()
+
+    def _setup(self, conn):
+        conn.row_factory = _dict_row
+        if self.read_only:
+            return
+
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL UNIQUE,
+                    title TEXT NOT NULL,
+                    snippet TEXT,
+                    source_name TEXT NOT NULL,
+                    published_at TEXT,
+                    image_url TEXT,
+                    author TEXT,
+                    full_text TEXT,
+                    scraped_at TEXT NOT NULL,
+                    cluster_key TEXT
+                )
+            """)
+
+            # Stores created before story clustering lack the column
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(articles)")}
+            if "cluster_key" not in existing:
+                conn.execute("ALTER TABLE articles ADD COLUMN cluster_key TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_articles_source_published ON articles (source_name, published_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_articles_cluster ON articles (cluster_key)"
+            )
+
+    def insert_rows(self, rows: Iterable[Dict]) -> int:
+        """
+        Bulk upsert article dicts (Article.to_dict() shape) in one transaction
+        """
+        values = [
+            (
+                row["url"], row["title"], row.get("snippet"), row["source_name"],
+                normalize_timestamp(row.get("published_at")), row.get("image_url"),
+                row.get("author"), row.get("full_text"),
+                normalize_timestamp(row.get("scraped_at") or datetime.now()),
+                row.get("cluster_key")
+            )
+            for row in rows
+        ]
+
+        with self.lock, self.conn:
+            self.conn.executemany(
+                f"""
+                INSERT INTO articles ({", ".join(COLUMNS)})
+                VALUES ({", ".join("?" for _ in COLUMNS)})
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title,
+                    snippet = excluded.snippet,
+                    published_at = excluded.published_at,
+                    image_url = COALESCE(excluded.image_url, articles.image_url),
+                    author = COALESCE(excluded.author, articles.author),
+                    full_text = COALESCE(excluded.full_text, articles.full_text),
+                    scraped_at = excluded.scraped_at,
+                    cluster_key = COALESCE(excluded.cluster_key, articles.cluster_key)
+                """,
+                values
+            )
+
+        return len(values)
+
+    def insert_articles(self, articles: List, scraped_at: Optional[datetime] = None) -> int:
+        """
+        Bulk upsert Article objects from one run
+        """
+        scraped_at = scraped_at or datetime.now()
+        return self.insert_rows(
+            dict(article.to_dict(), scraped_at=scraped_at) for article in articles
+        )
+
+    def import_json_file(self, path: Path) -> int:
+        """
+        Import one scraper output file (the save_to_json format)
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        scraped_at = data.get("scraped_at")
+        return self.insert_rows(
+            dict(article, scraped_at=scraped_at) for article in data.get("articles", [])
+        )
+
+    def query(
+        self,
+        source_name: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        url: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Articles matching all given filters, newest first
+        since/until bound published_at (since inclusive, until exclusive)
+        """
+        clauses, params = [], []
+
+        if url is not None:
+            clauses.append("url = ?")
+            params.append(url)
+        if source_name is not None:
+            clauses.append("source_name = ?")
+            params.append(source_name)
+        if since is not None:
+            clauses.append("published_at >= ?")
+            params.append(normalize_timestamp(since))
+        if until is not None:
+            clauses.append("published_at < ?")
+            params.append(normalize_timestamp(until))
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM articles"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY published_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def counts_by_source(self) -> Dict[str, int]:
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT source_name, COUNT(*) AS n FROM articles GROUP BY source_name ORDER BY source_name"
+            ).fetchall()
+        return {row["source_name"]: row["n"] for row in rows}
+
+
+def _dict_row(cursor, row) -> Dict:
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+# Global instance
+article_store = ArticleStore()
@@ -0,0 +1,174 @@
+"""
+Async Fetcher - Non-blocking HTTP engine for scrapers
+Lets one process keep many requests in flight across outlets while
+still honouring robots.txt and per-domain crawl delays
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from config import (
+    USER_AGENT, REQUEST_TIMEOUT, MAX_RETRIES,
+    MAX_CONCURRENT_REQUESTS, PER_HOST_CONCURRENCY, HTTP_CACHE_ENABLED
+)
+from utils.http_cache import FetchResult, HttpCache, http_cache
+from utils.metrics import metrics
+from utils.retry_policy import circuit_breaker, next_retry_delay
+from utils.robots_checker import check_url_allowed, wait_for_rate_limit_async
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFetcher:
+    """
+    Shared aiohttp session with per-host concurrency limits
+    Sessions are created lazily for whichever event loop is running;
+    call close() before that loop ends
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        per_host_concurrency: int = PER_HOST_CONCURRENCY,
+        cache: Optional[HttpCache] = None
+    ):
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.cache = cache
+        # Session and semaphores per event loop, so scrapers running their
+        # own loops on worker threads never share loop-bound objects
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._host_semaphores: Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]] = {}
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get (or create) the session for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            session = self._sessions.get(loop)
+
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_concurrency,
+                    limit_per_host=self.per_host_concurrency
+                )
+                session = aiohttp.ClientSession(
+                    connector=connector,
+                    headers={"User-Agent": USER_AGENT},
+                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+                )
+                self._sessions[loop] = session
+                self._host_semaphores[loop] = {}
+
+        return session
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """
+        Get (or create) the concurrency semaphore for a host
+        """
+        host = urlparse(url).netloc
+        semaphores = self._host_semaphores[asyncio.get_running_loop()]
+
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+
+        return semaphores[host]
+
+    async def fetch(self, url: str) -> Optional[FetchResult]:
+        """
+        Fetch a URL body with robots.txt compliance, rate limiting and retries
+        Retries back off with jitter and stop early once the circuit opens
+        Sends conditional-GET validators when an HTTP cache is configured
+        """
+        # Fail fast while the domain's circuit is open
+        if not circuit_breaker.allow(url):
+            logger.warning(f"Skipping {url} - circuit open for its domain")
+            return None
+
+        allowed = await asyncio.to_thread(check_url_allowed, url)
+        if not allowed:
+            logger.warning(f"Skipping {url} - blocked by robots.txt")
+            return None
+
+        session = self._get_session()
+
+        async with self._host_semaphore(url):
+            await wait_for_rate_limit_async(url)
+
+            for attempt in range(MAX_RETRIES):
+                try:
+                    logger.debug(f"Fetching {url} (attempt {attempt + 1}/{MAX_RETRIES})")
+
+                    headers = self.cache.conditional_headers(url) if self.cache else {}
+
+                    start = time.perf_counter()
+                    async with session.get(url, headers=headers) as response:
+                        if response.ok:
+                            body = await response.read()
+                    metrics.add_time("network", time.perf_counter() - start)
+                    metrics.record_response(response.status, len(body) if response.ok else 0)
+
+                    response.raise_for_status()
+
+                    circuit_breaker.record_success(url)
+
+                    if self.cache is None:
+                        return FetchResult(body, False, response.headers.get("Content-Type"))
+
+                    result = await asyncio.to_thread(
+                        self.cache.resolve, url, response.status, response.headers, body
+                    )
+                    if result is not None:
+                        return result
+                    # Cached body vanished under a 304 - retry unconditionally
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error(f"Error fetching {url}: {e}")
+
+                    is_status_error = isinstance(e, aiohttp.ClientResponseError)
+                    if not is_status_error:
+                        metrics.record_response(None)
+
+                    delay = next_retry_delay(
+                        url,
+                        attempt,
+                        status=e.status if is_status_error else None,
+                        retry_after=e.headers.get("Retry-After") if is_status_error and e.headers else None
+                    )
+
+                    if delay is None:
+                        logger.error(f"Failed to fetch {url} after {attempt + 1} attempts")
+                        return None
+
+                    logger.info(f"Retrying {url} in {delay:.1f}s")
+                    metrics.record_retry()
+                    await asyncio.sleep(delay)
+                    metrics.add_time("backoff", delay)
+
+        return None
+
+    async def close(self):
+        """
+        Close the session bound to the running event loop
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            session = self._sessions.pop(loop, None)
+            self._host_semaphores.pop(loop, None)
+
+        if session is not None and not session.closed:
+            await session.close()
+
+
+# Global instance
+async_fetcher = AsyncFetcher(cache=http_cache if HTTP_CACHE_ENABLED else None)
@@ -0,0 +1,258 @@
+"""
+DB Ingester - Bulk direct-to-database article ingestion
+Source IDs are looked up once, then articles go in as multi-row
+INSERT ... ON CONFLICT (url) DO NOTHING batches over pooled connections:
+a run costs a few round-trips instead of three per article
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from config import (
+    DATABASE_URL, SUPABASE_URL, SUPABASE_SERVICE_KEY,
+    DB_INGEST_BATCH_SIZE, DB_POOL_SIZE, SOURCES
+)
+from utils.local_db import open_db
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ["source_id", "title", "snippet", "full_text", "url", "image_url", "author", "published_at", "scraped_at"]
+
+# Bound-parameter limit of SQLite builds before 3.32; the stand-in splits
+# batches so one INSERT never goes over it
+SQLITE_MAX_VARIABLES = 999
+
+# Minimal subset of backend/database/schemas for the SQLite stand-in
+SQLITE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS sources (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        url TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY,
+        source_id TEXT REFERENCES sources(id),
+        title TEXT NOT NULL,
+        snippet TEXT,
+        full_text TEXT,
+        url TEXT UNIQUE NOT NULL,
+        image_url TEXT,
+        author TEXT,
+        published_at TEXT,
+        scraped_at TEXT
+    )
+    """
+]
+
+
+def chunks(rows: List, size: int) -> Iterable[List]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class _SqlBackend:
+    """
+    DB-API connection source: a psycopg2 pool for Postgres, or one shared
+    connection for a sqlite:/// stand-in (schema created, sources seeded
+    from config.SOURCES)
+    """
+
+    def __init__(self, dsn: str, pool_size: int):
+        if dsn.startswith("sqlite:///"):
+            self.placeholder = "?"
+            self.max_rows = SQLITE_MAX_VARIABLES // len(COLUMNS)
+            self.conn = open_db(Path(dsn[len("sqlite:///"):]))
+            self.lock = threading.Lock()
+            self.pool = None
+
+            with self.conn:
+                for statement in SQLITE_SCHEMA:
+                    self.conn.execute(statement)
+                self.conn.executemany(
+                    "INSERT INTO sources (id, name, url) VALUES (?, ?, ?) ON CONFLICT DO NOTHING",
+                    [(key, source["name"], source["url"]) for key, source in SOURCES.items()]
+                )
+            return
+
+        try:
+            from psycopg2.pool import ThreadedConnectionPool
+        except ImportError:
+            raise RuntimeError("Postgres ingestion requires the 'psycopg2-binary' package (pip install psycopg2-binary)")
+
+        self.placeholder = "%s"
+        self.max_rows = None
+        self.pool = ThreadedConnectionPool(1, pool_size, dsn)
+
+    @contextmanager
+    def connection(self):
+        """
+        A connection for one transaction: committed on success, rolled back on error
+        """
+        if self.pool is None:
+            with self.lock, self.conn:
+                yield self.conn
+            return
+
+        conn = self.pool.getconn()
+        try:
+            with conn:  # psycopg2: commit/rollback, connection stays open
+                yield conn
+        finally:
+            self.pool.putconn(conn)
+
+    def fetch_source_ids(self) -> Dict[str, str]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, name FROM sources")
+            return {name: str(source_id) for source_id, name in cursor.fetchall()}
+
+    def insert_batch(self, rows: List[tuple]) -> int:
+        """
+        Insert rows in one transaction; one statement per max_rows rows
+        (the whole batch on Postgres)
+        """
+        row_placeholders = "(" + ", ".join(self.placeholder for _ in COLUMNS) + ")"
+        inserted = 0
+
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for part in chunks(rows, self.max_rows or len(rows) or 1):
+                sql = (
+                    f"INSERT INTO articles ({', '.join(COLUMNS)}) VALUES "
+                    + ", ".join(row_placeholders for _ in part)
+                    + " ON CONFLICT (url) DO NOTHING"
+                )
+                cursor.execute(sql, [value for row in part for value in row])
+                inserted += cursor.rowcount  # rows actually inserted
+
+        return inserted
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.closeall()
+
+
+class _SupabaseBackend:
+    """
+    Supabase REST fallback when only SUPABASE_URL is configured
+    upsert(ignore_duplicates=True) is PostgREST's ON CONFLICT DO NOTHING
+    """
+
+    def __init__(self, url: str, key: str):
+        from supabase import create_client
+        self.client = create_client(url, key)
+
+    def fetch_source_ids(self) -> Dict[str, str]:
+        data = self.client.table("sources").select("id, name").execute().data
+        return {row["name"]: row["id"] for row in data}
+
+    def insert_batch(self, rows: List[tuple]) -> int:
+        records = [dict(zip(COLUMNS, row)) for row in rows]
+        response = self.client.table("articles").upsert(
+            records, on_conflict="url", ignore_duplicates=True
+        ).execute()
+        return len(response.data or [])
+
+    def close(self):
+        pass
+
+
+class DbIngester:
+    """
+    Bulk article ingestion into the backend's articles table
+    Connects on first use; source name -> id is cached for the process
+    """
+
+    def __init__(
+        self,
+        dsn: str = DATABASE_URL,
+        supabase_url: str = SUPABASE_URL,
+        supabase_key: str = SUPABASE_SERVICE_KEY,
+        batch_size: int = DB_INGEST_BATCH_SIZE,
+        pool_size: int = DB_POOL_SIZE
+    ):
+        self.dsn = dsn
+        self.supabase_url = supabase_url
+        self.supabase_key = supabase_key
+        self.batch_size = batch_size
+        self.pool_size = pool_size
+
+        self.lock = threading.Lock()
+        self._backend = None
+        self._source_ids: Optional[Dict[str, str]] = None
+
+    def _connect(self):
+        with self.lock:
+            if self._backend is None:
+                if self.dsn:
+                    self._backend = _SqlBackend(self.dsn, self.pool_size)
+                elif self.supabase_url and self.supabase_key:
+                    self._backend = _SupabaseBackend(self.supabase_url, self.supabase_key)
+                else:
+                    raise RuntimeError("Set DATABASE_URL (or SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY) to ingest")
+            return self._backend
+
+    def source_ids(self) -> Dict[str, str]:
+        """
+        Source name -> id, fetched once; also fills config.SOURCES[...]["source_id"]
+        """
+        backend = self._connect()
+
+        with self.lock:
+            if self._source_ids is None:
+                self._source_ids = backend.fetch_source_ids()
+                for source in SOURCES.values():
+                    source["source_id"] = self._source_ids.get(source["name"])
+                logger.info(f"[OK] Loaded {len(self._source_ids)} source IDs")
+
+            return self._source_ids
+
+    def ingest_rows(self, rows: Iterable[Dict]) -> int:
+        """
+        Insert article dicts (Article.to_dict() shape); returns rows inserted
+        Articles already in the table (by URL) and unknown sources are skipped
+        """
+        source_ids = self.source_ids()
+        scraped_at = datetime.now().isoformat()
+        values, unknown = [], set()
+
+        for row in rows:
+            source_id = source_ids.get(row["source_name"])
+            if source_id is None:
+                unknown.add(row["source_name"])
+                continue
+
+            values.append((
+                source_id, row["title"], row.get("snippet"), row.get("full_text"), row["url"],
+                row.get("image_url"), row.get("author"), row.get("published_at"),
+                row.get("scraped_at") or scraped_at
+            ))
+
+        for source_name in unknown:
+            logger.warning(f"Source \"{source_name}\" not found in database, its articles were skipped")
+
+        inserted = sum(self._backend.insert_batch(batch) for batch in chunks(values, self.batch_size))
+
+        logger.info(f"[OK] Ingested {inserted} new of {len(values)} articles ({len(values) - inserted} already stored)")
+        return inserted
+
+    def ingest_articles(self, articles: List) -> int:
+        """
+        Insert Article objects from one run
+        """
+        return self.ingest_rows(article.to_dict() for article in articles)
+
+    def close(self):
+        if self._backend is not None:
+            self._backend.close()
+
+
+# Global instance
+db_ingester = DbIngester()
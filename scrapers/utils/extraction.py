@@ -0,0 +1,246 @@
+"""
+Extraction Rules - Declarative page extraction compiled to lxml XPath
+A source's config.SOURCES[...]["extract"] spec is compiled once into
+etree.XPath objects; each page is then parsed once with lxml and every
+field is read with a precompiled expression instead of repeated
+BeautifulSoup find/find_all walks
+
+Selector syntax (each field takes one selector or a list of fallbacks,
+tried in order until one matches):
+    "div.feed-post-body"            descendant <div> with that class
+    "div.c-news__image img"         descendant steps, space separated
+    ".titulo" / "*"                 any tag
+    "preceding::img.foto"           XPath axis; reverse axes pick the nearest
+    "img@data-src|src"              first non-empty attribute ("text" = text content)
+    "."                             the context node itself
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Union
+
+from lxml import etree
+
+Selector = Union[str, Sequence[str]]
+
+STEP_RE = re.compile(r"^(?:(?P<axis>[a-z-]+)::)?(?P<tag>[A-Za-z][\w-]*|\*)?(?P<classes>(?:\.[\w-]+)*)$")
+REVERSE_AXES = {"ancestor", "ancestor-or-self", "preceding", "preceding-sibling", "parent"}
+
+HOMEPAGE_KEYS = {"container", "limit", "fallback_below", "link", "url", "title", "min_title_length", "snippet", "image"}
+ARTICLE_KEYS = {
+    "title", "snippet", "body", "paragraphs", "min_paragraph_length",
+    "author", "time", "time_formats", "image", "paywall"
+}
+
+# Text like BeautifulSoup's get_text(strip=True): script/style content and comments left out
+TEXT_NODES = ".//text()[not(parent::script) and not(parent::style)]"
+
+
+def _class_test(css_class: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')"
+
+
+def compile_path(selector: str) -> str:
+    """
+    Translate a selector (without @attributes) to an XPath relative to the context node
+    """
+    if selector.strip() == ".":
+        return "self::*"
+
+    steps = []
+    for step in selector.split():
+        match = STEP_RE.match(step)
+        if not match:
+            raise ValueError(f"Invalid selector step {step!r} in {selector!r}")
+
+        axis = match.group("axis") or "descendant"
+        tag = match.group("tag") or "*"
+        tests = [_class_test(css_class) for css_class in match.group("classes").split(".")[1:]]
+
+        xpath = f"{axis}::{tag}"
+        if tests:
+            xpath += "[" + " and ".join(tests) + "]"
+        if axis in REVERSE_AXES:
+            xpath += "[1]"  # nearest, like BeautifulSoup's find_previous/find_parent
+        steps.append(xpath)
+
+    return "/".join(steps)
+
+
+def _as_list(selector: Optional[Selector]) -> List[str]:
+    if selector is None:
+        return []
+    if isinstance(selector, str):
+        return [selector]
+    return list(selector)
+
+
+class FieldRule:
+    """
+    One field: fallback selectors, each with an optional attribute list
+    """
+
+    def __init__(self, selector: Optional[Selector], default_attrs: Sequence[str] = ("text",)):
+        self.candidates = []
+        for text in _as_list(selector):
+            path, _, attrs = text.partition("@")
+            self.candidates.append((
+                etree.XPath(compile_path(path)),
+                attrs.split("|") if attrs else list(default_attrs)
+            ))
+
+        self.text_nodes = etree.XPath(TEXT_NODES)
+
+    def __bool__(self) -> bool:
+        return bool(self.candidates)
+
+    def node(self, context) -> Optional[etree._Element]:
+        """
+        First node matched by the first selector that matches anything
+        """
+        for xpath, _ in self.candidates:
+            nodes = xpath(context)
+            if nodes:
+                return nodes[0]
+        return None
+
+    def nodes(self, context) -> list:
+        """
+        Every node matched by the first selector that matches anything
+        """
+        for xpath, _ in self.candidates:
+            nodes = xpath(context)
+            if nodes:
+                return nodes
+        return []
+
+    def text(self, node) -> str:
+        return "".join(part.strip() for part in self.text_nodes(node))
+
+    def value(self, context) -> Optional[str]:
+        """
+        Attribute (or text) of the first matching node; None if nothing
+        matched or every listed attribute is empty
+        """
+        for xpath, attrs in self.candidates:
+            nodes = xpath(context)
+            if not nodes:
+                continue
+
+            node = nodes[0]
+            for attr in attrs:
+                value = self.text(node) if attr == "text" else node.get(attr)
+                if value:
+                    return value
+            return None
+
+        return None
+
+
+def _check_keys(spec: Dict, allowed: set, page: str):
+    unknown = set(spec) - allowed
+    if unknown:
+        raise ValueError(f"Unknown {page} extraction keys: {', '.join(sorted(unknown))}")
+
+
+class HomepageRules:
+    """
+    Compiled homepage spec: article containers, then per-container fields
+    title is read inside the link node; snippet and image inside the container
+    """
+
+    def __init__(self, spec: Dict):
+        _check_keys(spec, HOMEPAGE_KEYS, "homepage")
+
+        self.containers = [etree.XPath(compile_path(selector)) for selector in _as_list(spec["container"])]
+        self.limit = spec.get("limit", 20)
+        self.fallback_below = spec.get("fallback_below", self.limit)
+        self.link = FieldRule(spec.get("link", "a"))
+        self.url = FieldRule(spec.get("url", ".@href"))
+        self.title = FieldRule(spec.get("title", "."))
+        self.min_title_length = spec.get("min_title_length", 1)
+        self.snippet = FieldRule(spec.get("snippet"))
+        self.image = FieldRule(spec.get("image"), default_attrs=("src",))
+
+    def find_containers(self, root) -> list:
+        """
+        Up to `limit` containers per selector; later selectors are only
+        used while fewer than `fallback_below` have been found
+        """
+        found = []
+        for xpath in self.containers:
+            found.extend(xpath(root)[:self.limit])
+            if len(found) >= self.fallback_below:
+                break
+        return found
+
+    def extract(self, container, with_image: bool = True) -> Optional[Dict]:
+        """
+        Raw fields of one container (relative URL, no snippet fallback);
+        None when it has no usable link or title
+        """
+        link = self.link.node(container)
+        if link is None:
+            return None
+
+        title = self.title.value(link) or ""
+        url = self.url.value(link)
+        if len(title) < self.min_title_length or not url:
+            return None
+
+        return {
+            "title": title,
+            "url": url,
+            "snippet": self.snippet.value(container) if self.snippet else None,
+            "image_url": self.image.value(container) if with_image and self.image else None
+        }
+
+
+class ArticleRules:
+    """
+    Compiled article-page spec
+    paragraphs are read inside body; paywall is a list of marker phrases
+    """
+
+    def __init__(self, spec: Dict):
+        _check_keys(spec, ARTICLE_KEYS, "article")
+
+        self.title = FieldRule(spec.get("title", "h1"))
+        self.snippet = FieldRule(spec.get("snippet"))
+        self.body = FieldRule(spec.get("body"))
+        self.paragraphs = FieldRule(spec.get("paragraphs", "p"))
+        self.min_paragraph_length = spec.get("min_paragraph_length", 1)
+        self.author = FieldRule(spec.get("author"))
+        self.time = FieldRule(spec.get("time"), default_attrs=("datetime", "text"))
+        self.time_formats = list(spec.get("time_formats", []))
+        self.image = FieldRule(spec.get("image"), default_attrs=("src",))
+        self.paywall = list(spec.get("paywall", []))
+
+    def extract(self, root, with_image: bool = True) -> Dict:
+        """
+        Raw fields of an article page (time as the page's string)
+        """
+        full_text = ""
+        body = self.body.node(root) if self.body else None
+        if body is not None:
+            texts = (self.paragraphs.text(paragraph) for paragraph in self.paragraphs.nodes(body))
+            full_text = "\n\n".join(text for text in texts if len(text) >= self.min_paragraph_length)
+
+        return {
+            "title": self.title.value(root) or "",
+            "snippet": self.snippet.value(root) if self.snippet else None,
+            "full_text": full_text,
+            "paywalled": any(marker in full_text for marker in self.paywall),
+            "author": self.author.value(root) if self.author else None,
+            "published_at": self.time.value(root) if self.time else None,
+            "image_url": self.image.value(root) if with_image and self.image else None
+        }
+
+
+class ExtractionRules:
+    """
+    Both page types of one source, compiled from SOURCES[...]["extract"]
+    """
+
+    def __init__(self, spec: Dict):
+        self.homepage = HomepageRules(spec["homepage"]) if "homepage" in spec else None
+        self.article = ArticleRules(spec["article"]) if "article" in spec else None
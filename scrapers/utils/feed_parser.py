@@ -0,0 +1,158 @@
+"""
+Feed Parser - Incremental RSS 2.0 / Atom parsing
+The feed body is downloaded (and cached) whole like any other page; it is
+then handed to lxml's pull parser in chunks and read item by item, each
+item discarded once read, so the parse tree stays small and the first
+item is available before the rest are parsed. The body itself is held in
+memory (feeds are capped at FEED_MAX_ITEMS items per run)
+"""
+
+import logging
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, Optional
+
+from lxml import etree, html
+
+logger = logging.getLogger(__name__)
+
+FEED_CHUNK_SIZE = 16 * 1024  # bytes handed to the parser at a time
+ITEM_TAGS = {"item", "entry"}  # RSS 2.0 / RSS 1.0 and Atom
+
+
+def _localname(element) -> str:
+    return etree.QName(element).localname if isinstance(element.tag, str) else ""
+
+
+def _children(element) -> Dict[str, list]:
+    """
+    Group an item's child elements by local name (namespaces dropped)
+    """
+    children: Dict[str, list] = {}
+    for child in element:
+        name = _localname(child)
+        if name:
+            children.setdefault(name, []).append(child)
+    return children
+
+
+def _text(children: Dict[str, list], *names: str) -> Optional[str]:
+    for name in names:
+        for element in children.get(name, []):
+            text = (element.text or "").strip()
+            if text:
+                return text
+    return None
+
+
+def _link(children: Dict[str, list]) -> Optional[str]:
+    for element in children.get("link", []):
+        # Atom: <link rel="alternate" href="..."/>; RSS: <link>url</link>
+        href = element.get("href")
+        if href and element.get("rel", "alternate") == "alternate":
+            return href.strip()
+        if element.text and element.text.strip():
+            return element.text.strip()
+    return _text(children, "guid", "id")
+
+
+def _image(children: Dict[str, list]) -> Optional[str]:
+    for name in ("enclosure", "content", "thumbnail"):
+        for element in children.get(name, []):
+            url = element.get("url")
+            media_type = element.get("type", "image")
+            if url and media_type.startswith("image"):
+                return url
+    return None
+
+
+def _author(children: Dict[str, list]) -> Optional[str]:
+    # Atom nests the name: <author><name>...</name></author>
+    for element in children.get("author", []):
+        name = _text(_children(element), "name")
+        if name:
+            return name
+    return _text(children, "creator", "author")
+
+
+def parse_feed_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an RFC 822 (RSS) or ISO 8601 (Atom) date
+    """
+    if not value:
+        return None
+
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        logger.debug(f"Unparseable feed date: {value}")
+        return None
+
+
+def html_to_text(markup: Optional[str]) -> str:
+    """
+    Strip tags from an HTML description
+    """
+    if not markup or not markup.strip():
+        return ""
+
+    try:
+        return " ".join(html.fromstring(markup).text_content().split())
+    except (etree.ParserError, ValueError):
+        return markup.strip()
+
+
+def iter_feed_entries(chunks: Iterable[bytes]) -> Iterator[Dict]:
+    """
+    Yield one dict per feed item as soon as the item has been parsed
+    Keys: title, url, summary, published_at, author, image_url
+    """
+    parser = etree.XMLPullParser(
+        events=("end",),
+        recover=True,
+        resolve_entities=False,
+        no_network=True
+    )
+
+    for chunk in chunks:
+        parser.feed(chunk)
+
+        for _, element in parser.read_events():
+            if _localname(element) not in ITEM_TAGS:
+                continue
+
+            children = _children(element)
+            entry = {
+                "title": _text(children, "title"),
+                "url": _link(children),
+                "summary": html_to_text(_text(children, "description", "summary", "content")),
+                "published_at": parse_feed_date(_text(children, "pubDate", "published", "updated", "date")),
+                "author": _author(children),
+                "image_url": _image(children)
+            }
+
+            # Drop the parsed item (and anything before it) to keep memory flat
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+            if entry["title"] and entry["url"]:
+                yield entry
+
+    parser.close()
+
+
+def chunked(content: bytes, chunk_size: int = FEED_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Split a buffered body into parser-sized chunks (the body is already in
+    memory; this only keeps each parser feed small)
+    """
+    for start in range(0, len(content), chunk_size):
+        yield content[start:start + chunk_size]
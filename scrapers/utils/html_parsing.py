@@ -0,0 +1,79 @@
+"""
+HTML Parsing - Charset handling and document construction
+Decodes with the declared charset instead of running encoding detection;
+bs4 is only imported by scrapers that build a soup
+"""
+
+import codecs
+import re
+from typing import TYPE_CHECKING, Optional
+
+import lxml.html
+from lxml import etree
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+META_SNIFF_BYTES = 4096  # charset meta must appear this early per the HTML spec (1024) with slack
+
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    """
+    Extract the charset parameter from a Content-Type header
+    """
+    if not content_type:
+        return None
+
+    match = CHARSET_RE.search(content_type)
+    return match.group(1) if match else None
+
+
+def sniff_meta_charset(content: bytes) -> Optional[str]:
+    """
+    Find a <meta charset> declaration near the top of the document
+    """
+    match = META_CHARSET_RE.search(content[:META_SNIFF_BYTES])
+    return match.group(1).decode("ascii") if match else None
+
+
+def declared_encoding(content: bytes, content_type: Optional[str] = None) -> Optional[str]:
+    """
+    Encoding declared by the server or the document, if it names a known codec
+    """
+    for candidate in (charset_from_content_type(content_type), sniff_meta_charset(content)):
+        if not candidate:
+            continue
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            continue
+
+    return None
+
+
+def parse_document(content: bytes, content_type: Optional[str] = None) -> etree._Element:
+    """
+    Parse HTML bytes into an lxml document
+    Raises etree.ParserError or ValueError if the page cannot be parsed
+    """
+    # Declared charset if any, else libxml2's own <meta> detection
+    parser = lxml.html.HTMLParser(encoding=declared_encoding(content, content_type))
+    return etree.fromstring(content, parser)
+
+
+def parse_html(content: bytes, encoding: Optional[str] = None) -> "BeautifulSoup":
+    """
+    Parse HTML bytes into a BeautifulSoup with lxml
+    With a known encoding the bytes are decoded directly, skipping
+    UnicodeDammit
+    """
+    from bs4 import BeautifulSoup
+
+    if encoding:
+        markup = content.decode(encoding, errors="replace")
+    else:
+        markup = content
+
+    return BeautifulSoup(markup, "lxml")
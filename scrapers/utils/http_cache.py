@@ -0,0 +1,207 @@
+"""
+HTTP Cache - Persistent conditional-GET cache for scraped pages
+Stores ETag/Last-Modified validators and body hashes so unchanged pages
+cost a 304 (or at most a download) and never a re-parse
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+from config import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES
+from utils.local_db import LazyDb
+
+logger = logging.getLogger(__name__)
+
+
+class FetchResult(NamedTuple):
+    """
+    Body of a fetched page and whether it matches the previous fetch
+    """
+    content: bytes
+    unchanged: bool
+    content_type: Optional[str] = None
+
+
+class HttpCache(LazyDb):
+    """
+    On-disk cache of response bodies plus a SQLite index of validators
+    Least-recently-used bodies are evicted once the cache exceeds max_bytes.
+    A held response (a listing page whose articles are still being written)
+    only replaces the cached one on commit(), so an interrupted run sees
+    the page as changed again next time
+    """
+
+    def __init__(self, cache_dir: Path = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        super().__init__(cache_dir / "index.db")
+        self.lock = threading.Lock()
+
+        # url -> (etag, last_modified, body_hash, body) of held responses
+        self.held: Dict[str, Tuple[Optional[str], Optional[str], str, bytes]] = {}
+
+    def _setup(self, conn):
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body_hash TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache (accessed_at)"
+            )
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.body"
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Validators to send with the next request for this URL
+        Only offered while the cached body is still on disk
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+        if row is None or not self._body_path(url).exists():
+            return {}
+
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def resolve(
+        self,
+        url: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        hold: bool = False
+    ) -> Optional[FetchResult]:
+        """
+        Turn a response into a FetchResult, updating the cache (with
+        hold=True, a changed body is only stored by commit(url))
+        Returns None on a 304 whose cached body has since been evicted
+        """
+        if status == 304:
+            try:
+                content = self._body_path(url).read_bytes()
+            except OSError:
+                self.forget(url)
+                return None
+
+            with self.lock, self.conn:
+                self.conn.execute(
+                    "UPDATE http_cache SET accessed_at = ? WHERE url = ?", (time.time(), url)
+                )
+            logger.debug(f"Not modified: {url}")
+            return FetchResult(content, True, headers.get("Content-Type"))
+
+        body_hash = hashlib.sha256(body).hexdigest()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT body_hash FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+        unchanged = row is not None and row[0] == body_hash
+
+        if hold and not unchanged:
+            with self.lock:
+                self.held[url] = (headers.get("ETag"), headers.get("Last-Modified"), body_hash, body)
+        else:
+            self._store(url, headers.get("ETag"), headers.get("Last-Modified"), body_hash, body, unchanged)
+
+        return FetchResult(body, unchanged, headers.get("Content-Type"))
+
+    def commit(self, url: str):
+        """
+        Store the held response for url, if any
+        """
+        with self.lock:
+            entry = self.held.pop(url, None)
+        if entry is not None:
+            self._store(url, *entry, unchanged=False)
+
+    def release(self, url: str):
+        """
+        Drop the held response for url; the cached one stays as it was
+        """
+        with self.lock:
+            self.held.pop(url, None)
+
+    def _store(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body_hash: str,
+        body: bytes,
+        unchanged: bool
+    ):
+        if not unchanged:
+            self._body_path(url).write_bytes(body)
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO http_cache
+                    (url, etag, last_modified, body_hash, size, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (url, etag, last_modified, body_hash, len(body), time.time())
+            )
+
+        if not unchanged:
+            self.evict()
+
+    def forget(self, url: str):
+        """
+        Drop a URL from the cache
+        """
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM http_cache WHERE url = ?", (url,))
+        self._body_path(url).unlink(missing_ok=True)
+
+    def evict(self):
+        """
+        Remove least-recently-used entries until the cache fits in max_bytes
+        """
+        with self.lock:
+            total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            victims = []
+            for url, size in self.conn.execute(
+                "SELECT url, size FROM http_cache ORDER BY accessed_at"
+            ):
+                if total <= self.max_bytes:
+                    break
+                victims.append(url)
+                total -= size
+
+            with self.conn:
+                self.conn.executemany("DELETE FROM http_cache WHERE url = ?", [(u,) for u in victims])
+
+        for url in victims:
+            self._body_path(url).unlink(missing_ok=True)
+
+        logger.debug(f"HTTP cache evicted {len(victims)} entries")
+
+
+# Global instance
+http_cache = HttpCache()
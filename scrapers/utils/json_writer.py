@@ -0,0 +1,84 @@
+"""
+JSON Writer - Streaming output in the per-run JSON file format
+Articles are appended to the file's "articles" array as they arrive, so
+only the article being written is held in memory. The file is written
+under a .tmp name and renamed into place when the run ends (also after a
+failure, with whatever was written so far); a run without articles
+leaves no file
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from config import OUTPUT_DIR, DATA_LITE_MODE
+
+logger = logging.getLogger(__name__)
+
+
+class JsonWriter:
+    """
+    Streams one source's run into OUTPUT_DIR/<source>_<timestamp>.json
+    Same fields as before streaming, plus "completed"; article_count comes
+    after the articles since it is only known at the end
+    """
+
+    def __init__(self, source_name: str, output_dir: Path = OUTPUT_DIR):
+        self.source_name = source_name
+        self.output_dir = output_dir
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.path = output_dir / f"{source_name.lower().replace(' ', '_')}_{timestamp}.json"
+        self.tmp_path = self.path.with_suffix(".json.tmp")
+
+        self.scraped_at = datetime.now().isoformat()
+        self.article_count = 0
+        self._file = None
+
+    def _open(self):
+        self.output_dir.mkdir(exist_ok=True)
+        self._file = open(self.tmp_path, "wb")
+
+        # Metadata via json, articles via Article.to_json
+        header = json.dumps({
+            "source": self.source_name,
+            "scraped_at": self.scraped_at,
+            "data_lite_mode": DATA_LITE_MODE
+        }, ensure_ascii=False)
+
+        self._file.write(header[:-1].encode("utf-8"))
+        self._file.write(b', "articles": [')
+
+    def write(self, article):
+        """
+        Append one article to the array (one article per line)
+        """
+        if self._file is None:
+            self._open()
+
+        self._file.write(b",\n" if self.article_count else b"\n")
+        self._file.write(article.to_json().encode("utf-8"))
+        self.article_count += 1
+
+    def close(self, completed: bool = True):
+        """
+        Finish the file and move it into place
+        """
+        if self._file is None:
+            return
+
+        trailer = f', "article_count": {self.article_count}, "completed": {json.dumps(completed)}}}\n'
+        self._file.write(b"\n]")
+        self._file.write(trailer.encode("utf-8"))
+        self._file.close()
+        self._file = None
+
+        self.tmp_path.replace(self.path)
+        logger.info(f"[OK] Saved {self.article_count} articles to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(completed=exc_type is None)
@@ -0,0 +1,66 @@
+"""
+Local SQLite helpers
+Shared by the on-disk caches so every store opens its database the same way
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+def open_db(path: Path, read_only: bool = False) -> sqlite3.Connection:
+    """
+    Open a SQLite database tuned for concurrent scraper access
+    WAL lets readers proceed while another thread or process writes;
+    the busy timeout makes writers wait instead of failing immediately.
+    With read_only=True the file must already exist and is never created
+    or modified (sqlite3.OperationalError otherwise)
+    """
+    if read_only:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+class LazyDb:
+    """
+    Base for stores backed by one SQLite file
+    The database is opened, and _setup() run on it, the first time
+    self.conn is used instead of at construction, so importing a store (or
+    running with it switched off) never touches disk. A read_only store
+    only opens an existing file (see open_db)
+    """
+
+    def __init__(self, db_path: Path, read_only: bool = False):
+        self.db_path = db_path
+        self.read_only = read_only
+        self._conn: Optional[sqlite3.Connection] = None
+        self._connect_lock = threading.Lock()
+
+    def _setup(self, conn: sqlite3.Connection):
+        """
+        Create tables and load in-memory state on a fresh connection
+        (use `conn`, not self.conn, which is not set yet)
+        """
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = self._conn
+        return conn if conn is not None else self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._connect_lock:
+            if self._conn is None:
+                conn = open_db(self.db_path, self.read_only)
+                self._setup(conn)
+                self._conn = conn
+            return self._conn
@@ -0,0 +1,326 @@
+"""
+Run Metrics - Per-source stage timings and fetch counters
+BaseScraper.run opens a run for its source; every hook called while it
+runs (robots checks, rate-limit sleeps, network, parse, extract, write)
+is charged to that source, including from the async fetcher's threads.
+Totals are cumulative for the process and exported as a JSON run summary
+and a Prometheus textfile, named after the process's scope so concurrent
+processes (a daemon and a one-off run) each keep their own
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from config import METRICS_ENABLED, METRICS_SUMMARY_FILE, METRICS_TEXTFILE
+
+logger = logging.getLogger(__name__)
+
+# Stages in pipeline order (summary and textfile list them this way)
+STAGES = ["robots", "rate_limit", "network", "backoff", "parse", "extract", "dedup", "write"]
+
+_DONE = object()  # end-of-iterator marker for timed()
+
+# Source whose run the current thread/task is working for
+_current_source: ContextVar[Optional[str]] = ContextVar("metrics_source", default=None)
+
+
+class SourceMetrics:
+    """
+    Counters for one source, cumulative across runs
+    Stage seconds are summed over concurrent requests, so during enrichment
+    they can add up to more than the run's wall time
+    """
+
+    def __init__(self):
+        self.stage_seconds: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self.stage_calls: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.bytes_downloaded = 0
+        self.status_counts: Dict[str, int] = {}
+        self.retries = 0
+        self.articles = 0
+        self.runs = 0
+        self.failed_runs = 0
+        self.last_run_seconds = 0.0
+        self.last_success: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "runs": self.runs,
+            "failed_runs": self.failed_runs,
+            "articles": self.articles,
+            "last_run_seconds": round(self.last_run_seconds, 3),
+            "last_success": datetime.fromtimestamp(self.last_success).isoformat() if self.last_success else None,
+            "stage_seconds": {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()},
+            "stage_calls": dict(self.stage_calls),
+            "bytes_downloaded": self.bytes_downloaded,
+            "http_status_counts": dict(sorted(self.status_counts.items())),
+            "retries": self.retries
+        }
+
+
+class RunMetrics:
+    """
+    Thread-safe per-source metrics registry
+    Hooks are no-ops outside a run (or with METRICS_ENABLED off)
+    """
+
+    def __init__(
+        self,
+        enabled: bool = METRICS_ENABLED,
+        summary_file: Path = METRICS_SUMMARY_FILE,
+        textfile: Path = METRICS_TEXTFILE
+    ):
+        self.enabled = enabled
+        self.summary_file = summary_file
+        self.textfile = textfile
+        self.scope: Optional[str] = None
+
+        self.lock = threading.Lock()
+        self.sources: Dict[str, SourceMetrics] = {}
+        self.started_at = time.time()
+
+    def set_scope(self, scope: str):
+        """
+        Name what this process runs (e.g. "all", "daemon-g1"): its files
+        get the scope as a suffix and its textfile samples a scope label
+        """
+        self.scope = scope.lower().replace(" ", "_")
+
+    def _scoped(self, path: Path) -> Path:
+        if self.scope is None:
+            return path
+        return path.with_name(f"{path.stem}.{self.scope}{path.suffix}")
+
+    def _source(self) -> Optional[SourceMetrics]:
+        # Called with self.lock held
+        name = _current_source.get()
+        if name is None:
+            return None
+        if name not in self.sources:
+            self.sources[name] = SourceMetrics()
+        return self.sources[name]
+
+    @contextmanager
+    def run(self, source_name: str):
+        """
+        Charge hooks in this block to source_name and time the whole run
+        The caller sets `.articles` on the yielded record; an exception or
+        a record left with failed=True counts as a failed run
+        """
+        if not self.enabled:
+            yield _RunRecord()
+            return
+
+        token = _current_source.set(source_name)
+        record = _RunRecord()
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record.failed = True
+            raise
+        finally:
+            _current_source.reset(token)
+            elapsed = time.perf_counter() - start
+
+            with self.lock:
+                source = self.sources.setdefault(source_name, SourceMetrics())
+                source.runs += 1
+                source.articles += record.articles
+                source.last_run_seconds = elapsed
+                if record.failed:
+                    source.failed_runs += 1
+                else:
+                    source.last_success = time.time()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time a block as one call of the given stage
+        """
+        if not self.enabled or _current_source.get() is None:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def timed(self, name: str, items: Iterable) -> Iterator:
+        """
+        Yield from items, timing only the production of each item as the
+        given stage (time spent downstream of a yield is not charged)
+        """
+        iterator = iter(items)
+        while True:
+            with self.stage(name):
+                item = next(iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+
+    def add_time(self, name: str, seconds: float):
+        """
+        Charge seconds measured elsewhere (e.g. a sleep) to a stage
+        """
+        if not self.enabled:
+            return
+
+        with self.lock:
+            source = self._source()
+            if source is not None:
+                source.stage_seconds[name] = source.stage_seconds.get(name, 0.0) + seconds
+                source.stage_calls[name] = source.stage_calls.get(name, 0) + 1
+
+    def record_response(self, status: Optional[int], nbytes: int = 0):
+        """
+        Count one HTTP response (status None: no response, e.g. a timeout)
+        """
+        if not self.enabled:
+            return
+
+        key = str(status) if status is not None else "error"
+        with self.lock:
+            source = self._source()
+            if source is not None:
+                source.status_counts[key] = source.status_counts.get(key, 0) + 1
+                source.bytes_downloaded += nbytes
+
+    def record_retry(self):
+        if not self.enabled:
+            return
+
+        with self.lock:
+            source = self._source()
+            if source is not None:
+                source.retries += 1
+
+    def summary(self) -> Dict:
+        with self.lock:
+            return {
+                "generated_at": datetime.now().isoformat(),
+                "process_started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+                "pid": os.getpid(),
+                "scope": self.scope,
+                "sources": {name: source.to_dict() for name, source in sorted(self.sources.items())}
+            }
+
+    def prometheus_text(self) -> str:
+        """
+        Prometheus text exposition format (counters are per process)
+        """
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                if self.scope is not None:
+                    labels = {"scope": self.scope, **labels}
+                label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}")
+
+        with self.lock:
+            sources = sorted(self.sources.items())
+
+            metric(
+                "espectro_scraper_stage_seconds_total", "counter",
+                "Seconds spent per scraper stage (summed over concurrent requests)",
+                [({"source": name, "stage": stage}, round(seconds, 6))
+                 for name, source in sources for stage, seconds in source.stage_seconds.items()]
+            )
+            metric(
+                "espectro_scraper_stage_calls_total", "counter", "Timed calls per scraper stage",
+                [({"source": name, "stage": stage}, calls)
+                 for name, source in sources for stage, calls in source.stage_calls.items()]
+            )
+            metric(
+                "espectro_scraper_downloaded_bytes_total", "counter", "Response body bytes downloaded",
+                [({"source": name}, source.bytes_downloaded) for name, source in sources]
+            )
+            metric(
+                "espectro_scraper_http_responses_total", "counter", "HTTP responses by status (error: no response)",
+                [({"source": name, "status": status}, count)
+                 for name, source in sources for status, count in sorted(source.status_counts.items())]
+            )
+            metric(
+                "espectro_scraper_retries_total", "counter", "Fetch retries after a failed attempt",
+                [({"source": name}, source.retries) for name, source in sources]
+            )
+            metric(
+                "espectro_scraper_articles_total", "counter", "Articles emitted by runs",
+                [({"source": name}, source.articles) for name, source in sources]
+            )
+            metric(
+                "espectro_scraper_runs_total", "counter", "Scraper runs by result",
+                [({"source": name, "result": result}, count)
+                 for name, source in sources
+                 for result, count in (("success", source.runs - source.failed_runs), ("failure", source.failed_runs))]
+            )
+            metric(
+                "espectro_scraper_last_run_duration_seconds", "gauge", "Wall time of the latest run",
+                [({"source": name}, round(source.last_run_seconds, 6)) for name, source in sources]
+            )
+            metric(
+                "espectro_scraper_last_success_timestamp_seconds", "gauge", "Unix time the latest successful run ended",
+                [({"source": name}, round(source.last_success, 3))
+                 for name, source in sources if source.last_success is not None]
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def export(self):
+        """
+        Write the JSON run summary and the Prometheus textfile
+        Both are written to a temp file and renamed, so readers (and
+        node_exporter) never see a partial file
+        """
+        if not self.enabled:
+            return
+
+        summary_file = self._scoped(self.summary_file)
+        textfile = self._scoped(self.textfile)
+
+        try:
+            _write_atomic(summary_file, json.dumps(self.summary(), indent=2, ensure_ascii=False) + "\n")
+            _write_atomic(textfile, self.prometheus_text())
+        except OSError as e:
+            logger.error(f"✗ Could not write run metrics: {e}")
+            return
+
+        logger.info(f"[OK] Run metrics written to {summary_file} and {textfile}")
+
+
+class _RunRecord:
+    """
+    Outcome of one run, filled in by the caller of RunMetrics.run
+    """
+
+    def __init__(self):
+        self.articles = 0
+        self.failed = False
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _write_atomic(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+# Global instance
+metrics = RunMetrics()
@@ -0,0 +1,169 @@
+"""
+NDJSON Writer - Streaming article output
+Each article is written as one JSON line and flushed immediately, so a
+crash mid-run keeps everything extracted so far and consumers can tail
+the file. Parts rotate by size or age and may be gzip/zstd compressed.
+"""
+
+import gzip
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from config import (
+    NDJSON_OUTPUT_DIR, OUTPUT_COMPRESSION,
+    NDJSON_ROTATE_BYTES, NDJSON_ROTATE_SECONDS, DATA_LITE_MODE
+)
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+class _ZstdStream:
+    """
+    Minimal binary writer over zstandard's stream_writer
+    """
+
+    def __init__(self, path: Path):
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd output requires the 'zstandard' package (pip install zstandard)")
+
+        self.file = open(path, "wb")
+        self.writer = zstandard.ZstdCompressor(level=3).stream_writer(self.file)
+
+    def write(self, data: bytes):
+        self.writer.write(data)
+
+    def flush(self):
+        # Ends the current block so everything written so far is decodable
+        self.writer.flush()
+        self.file.flush()
+
+    def close(self):
+        self.writer.close()  # also closes self.file
+
+
+class NdjsonWriter:
+    """
+    Streams articles for one source and run into rotating NDJSON parts
+    A manifest next to the parts records the run metadata (same fields as
+    the JSON output), the part files and whether the run completed; both
+    are created by the first write, so a run without articles leaves nothing
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        output_dir: Path = NDJSON_OUTPUT_DIR,
+        compression: str = OUTPUT_COMPRESSION,
+        rotate_bytes: int = NDJSON_ROTATE_BYTES,
+        rotate_seconds: float = NDJSON_ROTATE_SECONDS
+    ):
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression: {compression} (expected one of {', '.join(COMPRESSION_SUFFIXES)})")
+
+        self.source_name = source_name
+        self.output_dir = output_dir
+        self.compression = compression
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.basename = f"{source_name.lower().replace(' ', '_')}_{timestamp}"
+        self.manifest_path = self.output_dir / f"{self.basename}.manifest.json"
+
+        self.scraped_at = datetime.now().isoformat()
+        self.article_count = 0
+        self.files: List[str] = []
+        self._stream = None
+        self._part_bytes = 0
+        self._part_opened_at = 0.0
+
+    def _open_part(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"{self.basename}.part{len(self.files) + 1:04d}.ndjson{COMPRESSION_SUFFIXES[self.compression]}"
+
+        if self.compression == "gzip":
+            self._stream = gzip.open(path, "wb")
+        elif self.compression == "zstd":
+            self._stream = _ZstdStream(path)
+        else:
+            self._stream = open(path, "wb")
+
+        self.files.append(path.name)
+        self._part_bytes = 0
+        self._part_opened_at = time.monotonic()
+        self._write_manifest(completed=False)
+
+    def _close_part(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _should_rotate(self) -> bool:
+        if self._stream is None:
+            return True
+        if self.rotate_bytes and self._part_bytes >= self.rotate_bytes:
+            return True
+        if self.rotate_seconds and time.monotonic() - self._part_opened_at >= self.rotate_seconds:
+            return True
+        return False
+
+    def _write_manifest(self, completed: bool):
+        manifest: Dict = {
+            "source": self.source_name,
+            "scraped_at": self.scraped_at,
+            "article_count": self.article_count,
+            "data_lite_mode": DATA_LITE_MODE,
+            "compression": self.compression,
+            "files": self.files,
+            "completed": completed
+        }
+
+        # Write-then-rename so readers never see a half-written manifest
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_path.replace(self.manifest_path)
+
+    def write(self, article):
+        """
+        Append one article as a JSON line and flush it to disk
+        """
+        if self._should_rotate():
+            self._close_part()
+            self._open_part()
+
+        data = (article.to_json() + "\n").encode("utf-8")
+
+        self._stream.write(data)
+        self._stream.flush()
+
+        self._part_bytes += len(data)
+        self.article_count += 1
+
+    def close(self, completed: bool = True):
+        """
+        Close the current part and finalize the manifest
+        """
+        if not self.files:
+            return
+
+        self._close_part()
+        self._write_manifest(completed=completed)
+
+        logger.info(
+            f"[OK] Streamed {self.article_count} articles to {len(self.files)} file(s), "
+            f"manifest {self.manifest_path}"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(completed=exc_type is None)
@@ -0,0 +1,210 @@
+"""
+Near-Duplicate Detection - SimHash over title + snippet
+Recent fingerprints from every source live in a shared SQLite table, so wire
+copy republished by several outlets (or by one outlet under a new URL) is
+caught before detail fetches, database writes and bias analysis
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from itertools import chain
+from typing import Iterable, List, Optional, Tuple
+
+from config import (
+    NEAR_DUP_DB, NEAR_DUP_MAX_DISTANCE, NEAR_DUP_WINDOW_HOURS, NEAR_DUP_MIN_TOKENS
+)
+from utils.local_db import LazyDb
+
+logger = logging.getLogger(__name__)
+
+BITS = 64
+MASK = (1 << BITS) - 1
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase, accent-stripped word tokens
+    """
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return TOKEN_PATTERN.findall(stripped)
+
+
+def simhash(tokens: List[str]) -> int:
+    """
+    64-bit SimHash of word tokens
+    Unigrams only: with headline-length texts, shingles make a one-word
+    edit move the hash about as far as a different story does
+    """
+    weights = [0] * BITS
+
+    for token in tokens:
+        h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+        for bit in range(BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _to_signed(value: int) -> int:
+    # SQLite integers are signed 64-bit
+    return value - (1 << BITS) if value >> (BITS - 1) else value
+
+
+class NearDuplicateIndex(LazyDb):
+    """
+    Fingerprints of recently emitted articles, keyed by (canonical) URL
+    The window (a few thousand headlines) is mirrored in memory and
+    scanned linearly; rows added by other processes are picked up on each
+    call. Articles still in a pipeline are held in memory until they are
+    written (record) or dropped (release)
+    """
+
+    def __init__(
+        self,
+        db_path: Path = NEAR_DUP_DB,
+        max_distance: int = NEAR_DUP_MAX_DISTANCE,
+        window_hours: int = NEAR_DUP_WINDOW_HOURS,
+        min_tokens: int = NEAR_DUP_MIN_TOKENS
+    ):
+        super().__init__(db_path)
+        self.lock = threading.Lock()
+        self.max_distance = max_distance
+        self.window = window_hours * 3600
+        self.min_tokens = min_tokens
+
+        # url -> (source_name, simhash, seen_at)
+        self.recent = {}
+        self.pending = {}
+        self.synced_at = 0.0
+
+    def _setup(self, conn):
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS fingerprints (
+                    url TEXT PRIMARY KEY,
+                    source_name TEXT NOT NULL,
+                    simhash INTEGER NOT NULL,
+                    seen_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_fingerprints_seen ON fingerprints (seen_at)")
+            conn.execute("DELETE FROM fingerprints WHERE seen_at < ?", (time.time() - self.window,))
+
+    def _sync(self, now: float):
+        """
+        Pull rows written since the last sync and expire ones outside the window
+        """
+        since = now - self.window
+        rows = self.conn.execute(
+            "SELECT url, source_name, simhash, seen_at FROM fingerprints WHERE seen_at >= ?",
+            # Overlap covers rows other processes stamped before committing
+            (max(since, self.synced_at - 60),)
+        ).fetchall()
+
+        for url, source_name, value, seen_at in rows:
+            self.recent[url] = (source_name, value & MASK, seen_at)
+
+        self.recent = {url: entry for url, entry in self.recent.items() if entry[2] >= since}
+        self.synced_at = now
+
+    def fingerprint(self, article) -> Optional[int]:
+        """
+        SimHash of an article's title + snippet, or None if too short to judge
+        """
+        tokens = tokenize(f"{article.title} {article.snippet or ''}")
+        if len(tokens) < self.min_tokens:
+            return None
+        return simhash(tokens)
+
+    def find_match(self, url: str, value: int) -> Optional[Tuple[str, str, int]]:
+        """
+        (url, source_name, distance) of the closest recent fingerprint within
+        max_distance, ignoring the article's own URL
+        """
+        best = None
+
+        for other_url, (source_name, other, _) in chain(self.recent.items(), self.pending.items()):
+            if other_url == url:
+                continue
+            distance = hamming_distance(value, other)
+            if distance <= self.max_distance and (best is None or distance < best[2]):
+                best = (other_url, source_name, distance)
+
+        return best
+
+    def is_new(self, article) -> bool:
+        """
+        False if title + snippet nearly match an article emitted (by any
+        source) within the window, or one still held by a pipeline; else
+        the article is held until record() or release()
+        Same-URL matches never count, so re-scraped or edited articles pass
+        """
+        now = time.time()
+
+        with self.lock:
+            self._sync(now)
+
+            value = self.fingerprint(article)
+            if value is None:
+                return True
+
+            match = self.find_match(article.url, value)
+            if match:
+                other_url, source_name, distance = match
+                logger.info(f"Near-duplicate ({distance} bits) of {source_name} {other_url}: {article.url}")
+                return False
+
+            # Held right away so sources running in parallel see each other
+            self.pending[article.url] = (article.source_name, value, now)
+            return True
+
+    def record(self, urls: Iterable[str]):
+        """
+        Store the held fingerprints of articles that were written
+        """
+        now = time.time()
+
+        with self.lock, self.conn:
+            rows = []
+            for url in urls:
+                entry = self.pending.pop(url, None)
+                if entry is None:
+                    continue
+                source_name, value, _ = entry
+                self.recent[url] = (source_name, value, now)
+                rows.append((url, source_name, _to_signed(value), now))
+
+            self.conn.executemany(
+                """
+                INSERT INTO fingerprints (url, source_name, simhash, seen_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    simhash = excluded.simhash,
+                    seen_at = excluded.seen_at
+                """,
+                rows
+            )
+
+    def release(self, urls: Iterable[str]):
+        """
+        Forget the held fingerprints of articles that were never written
+        """
+        with self.lock:
+            for url in urls:
+                self.pending.pop(url, None)
+
+
+# Global instance
+near_duplicates = NearDuplicateIndex()
@@ -0,0 +1,111 @@
+"""
+Parse Pool - Article-page parsing on a pool of worker processes
+Fetching stays on each scraper's event loop; the raw bytes are handed to
+a ProcessPoolExecutor whose workers parse them with lxml and send back
+the extracted fields (spec-driven sources), so parsing is no longer bound
+to one core by the GIL. Workers import only the extraction code, never
+the scrapers or their stores, and every option that affects extraction
+travels with the task. Pages waiting for a worker are bounded per event
+loop (backpressure on the fetchers)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from lxml import etree
+
+from config import PARSE_WORKERS, PARSE_QUEUE_SIZE, SOURCES
+from utils.extraction import ArticleRules
+from utils.html_parsing import parse_document
+
+logger = logging.getLogger(__name__)
+
+# Worker side: compiled article rules per source, built on first use in each process
+_worker_rules: Dict[str, ArticleRules] = {}
+
+
+def _extract_article(source_key: str, content: bytes, content_type: Optional[str], with_image: bool) -> Optional[Dict]:
+    """
+    Runs in a worker process: ArticleRules.extract fields of one article
+    page, or None if it cannot be parsed
+    """
+    rules = _worker_rules.get(source_key)
+    if rules is None:
+        rules = _worker_rules[source_key] = ArticleRules(SOURCES[source_key]["extract"]["article"])
+
+    try:
+        root = parse_document(content, content_type)
+    except (etree.ParserError, ValueError):
+        return None
+    return rules.extract(root, with_image=with_image)
+
+
+class ParsePool:
+    """
+    Shared process pool, started on first use
+    Workers are spawned (not forked): scraper processes are multi-threaded
+    and a forked child could inherit a lock held by another thread
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS, queue_size: int = PARSE_QUEUE_SIZE):
+        self.workers = workers
+        self.queue_size = queue_size
+
+        self.lock = threading.Lock()
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+    def configure(self, workers: int):
+        self.workers = workers
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"[OK] Started {self.workers} parse workers")
+            return self.executor
+
+    def _queue_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            slots = self._slots.get(loop)
+            if slots is None:
+                slots = self._slots[loop] = asyncio.Semaphore(self.queue_size)
+            return slots
+
+    async def extract_article(self, source_key: str, result, with_image: bool) -> Optional[Dict]:
+        """
+        Extract a fetched article page (FetchResult) of a spec-driven source
+        on a worker; with_image=False when running in data-lite mode
+        Waits for a queue slot first when queue_size pages are already pending
+        """
+        executor = self._get_executor()
+
+        async with self._queue_slots():
+            future = executor.submit(_extract_article, source_key, result.content, result.content_type, with_image)
+            return await asyncio.wrap_future(future)
+
+    def close(self):
+        """
+        Stop the workers (a later parse starts a new pool)
+        """
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# Global instance
+parse_pool = ParsePool()
@@ -0,0 +1,271 @@
+"""
+Article Pipeline - Streaming stages between a scraper and its sinks
+Articles are pulled through a chain of generator stages (dedup, enrich,
+write, commit) one at a time, so the first article reaches the sinks as
+soon as it is extracted and only articles in flight are held in memory.
+However a run ends, every stage is closed: what already went through is
+flushed and committed, and only what had not been reached is lost
+"""
+
+import logging
+import threading
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from config import ENRICH_CONCURRENCY, PIPELINE_BATCH_SIZE
+from utils.metrics import metrics
+from utils.near_duplicates import near_duplicates
+from utils.seen_index import content_hash, seen_index
+from utils.story_clustering import story_clusterer
+
+logger = logging.getLogger(__name__)
+
+
+class Stage:
+    """
+    One pipeline step
+    process() wraps the upstream iterator in a generator; close() runs
+    once the run is over (completed=False after a failure). A stage that
+    buffers articles should pass the ones it already took downstream
+    before letting an upstream error through
+    """
+
+    def process(self, articles: Iterator) -> Iterator:
+        return articles
+
+    def close(self, completed: bool):
+        pass
+
+
+class DedupStage(Stage):
+    """
+    Drops repeats and assigns story clusters, article by article:
+    URLs seen in earlier runs (incremental), near-copies of recent articles
+    from any source (near_dedup), then cluster_key (cluster)
+    Nothing is stored until the articles are committed (record), except
+    near-copies, marked seen as they are dropped; what never gets committed
+    is released when the run ends
+    """
+
+    def __init__(self, source_name: str, incremental: bool, near_dedup: bool, cluster: bool):
+        self.source_name = source_name
+        self.incremental = incremental
+        self.near_dedup = near_dedup
+        self.cluster = cluster
+
+        # url -> content hash taken before enrichment, until recorded
+        self.pending = {}
+        # urls held by the near-duplicate and cluster indexes, until recorded
+        self.held = set()
+        self.scraped = 0
+        self.unseen = 0
+        self.near_copies = 0
+        self.clusters = set()
+
+    def keep(self, article) -> bool:
+        self.scraped += 1
+
+        if self.incremental:
+            if not seen_index.is_unseen(article):
+                return False
+            self.pending[article.url] = content_hash(article)
+        self.unseen += 1
+
+        if self.near_dedup and not near_duplicates.is_new(article):
+            self.near_copies += 1
+            # Seen now, so later incremental runs skip it instead of
+            # fetching and dropping it again
+            if self.incremental:
+                seen_index.record([(article.url, self.pending.pop(article.url))])
+            return False
+
+        if self.cluster:
+            self.clusters.add(story_clusterer.assign(article))
+
+        if self.near_dedup or self.cluster:
+            self.held.add(article.url)
+        return True
+
+    def process(self, articles: Iterator) -> Iterator:
+        for article in articles:
+            with metrics.stage("dedup"):
+                keep = self.keep(article)
+            if keep:
+                yield article
+
+    def record(self, articles: List):
+        """
+        Record committed articles in the seen-URL, near-duplicate and
+        cluster indexes (commit handler)
+        """
+        if self.incremental:
+            snapshot = [(article.url, self.pending.pop(article.url)) for article in articles if article.url in self.pending]
+            seen_index.record(snapshot)
+
+        urls = [article.url for article in articles if article.url in self.held]
+        self.held.difference_update(urls)
+        if self.near_dedup:
+            near_duplicates.record(urls)
+        if self.cluster:
+            story_clusterer.record(urls)
+
+    def release(self, completed: bool):
+        """
+        Drop what was kept but never committed (a failed run, or articles
+        still being enriched when it stopped); runs after the last commit
+        """
+        if self.near_dedup:
+            near_duplicates.release(self.held)
+        if self.cluster:
+            story_clusterer.release(self.held)
+
+        self.held.clear()
+        self.pending.clear()
+
+    def close(self, completed: bool):
+        logger.info(f"[OK] Scraped {self.scraped} articles from {self.source_name}")
+        if self.incremental:
+            logger.info(f"{self.unseen} of {self.scraped} articles are new or changed")
+        if self.near_copies:
+            logger.info(f"Dropped {self.near_copies} near-duplicate articles")
+        if self.cluster:
+            logger.info(f"[OK] Clustered {self.unseen - self.near_copies} articles into {len(self.clusters)} stories")
+
+
+class EnrichStage(Stage):
+    """
+    Full-text enrichment (BaseScraper.iter_enriched); articles come out
+    in the order their detail pages finish
+    """
+
+    def __init__(self, scraper, concurrency: int = ENRICH_CONCURRENCY):
+        self.scraper = scraper
+        self.concurrency = concurrency
+
+    def process(self, articles: Iterator) -> Iterator:
+        return self.scraper.iter_enriched(articles, self.concurrency)
+
+
+class WriteStage(Stage):
+    """
+    Hands each article to a streaming sink (NDJSON/JSON writer, push sink)
+    as it passes; finish(completed) runs when the run ends
+    """
+
+    def __init__(self, write: Callable, finish: Optional[Callable[[bool], None]] = None):
+        self.write = write
+        self.finish = finish
+
+    def process(self, articles: Iterator) -> Iterator:
+        for article in articles:
+            with metrics.stage("write"):
+                self.write(article)
+            yield article
+
+    def close(self, completed: bool):
+        if self.finish is not None:
+            with metrics.stage("write"):
+                self.finish(completed)
+
+
+class CommitStage(Stage):
+    """
+    Collects articles into batches for sinks that write in bulk (article
+    store, database ingest, dedup indexes); handlers run in order on each
+    full batch and on the remainder at close, failed run or not, and
+    finish(completed) runs after that
+    """
+
+    def __init__(
+        self,
+        handlers: List[Callable[[List], object]],
+        batch_size: int = PIPELINE_BATCH_SIZE,
+        finish: Optional[Callable[[bool], None]] = None
+    ):
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.finish = finish
+        self.batch: List = []
+
+    def commit(self):
+        batch, self.batch = self.batch, []
+        if not batch:
+            return
+
+        with metrics.stage("write"):
+            for handler in self.handlers:
+                handler(batch)
+
+    def process(self, articles: Iterator) -> Iterator:
+        for article in articles:
+            self.batch.append(article)
+            if len(self.batch) >= self.batch_size:
+                self.commit()
+            yield article
+
+    def close(self, completed: bool):
+        try:
+            self.commit()
+        finally:
+            if self.finish is not None:
+                self.finish(completed)
+
+
+class Pipeline:
+    """
+    Stages chained in order over a source iterator
+    """
+
+    def __init__(self, stages: List[Stage]):
+        self.stages = stages
+
+    def stream(self, articles: Iterable, stop_event: Optional[threading.Event] = None) -> Iterator:
+        """
+        Yield articles as they leave the last stage
+        Every stage is closed when the stream ends, fails or is abandoned.
+        Once stop_event is set no more articles are pulled from the source:
+        those in flight are finished, then the stages close as after a
+        failure (completed=False)
+        """
+        iterators = [iter(articles) if stop_event is None else _until(articles, stop_event)]
+        for stage in self.stages:
+            iterators.append(stage.process(iterators[-1]))
+
+        completed = False
+        try:
+            yield from iterators[-1]
+            completed = stop_event is None or not stop_event.is_set()
+        finally:
+            # Stop stages still suspended (e.g. upstream of a failed one) first
+            for iterator in reversed(iterators):
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+            self.close(completed)
+
+    def close(self, completed: bool):
+        """
+        Close every stage, even if one of them fails; the first error is
+        raised afterwards
+        """
+        error = None
+
+        for stage in self.stages:
+            try:
+                stage.close(completed)
+            except Exception as e:
+                logger.error(f"✗ Error closing {type(stage).__name__}: {e}", exc_info=True)
+                error = error or e
+
+        if error is not None:
+            raise error
+
+
+def _until(articles: Iterable, stop_event: threading.Event) -> Iterator:
+    """
+    Items of articles, up to the first one pulled after stop_event is set
+    """
+    for article in articles:
+        if stop_event.is_set():
+            logger.info("Stop requested, not pulling more articles")
+            return
+        yield article
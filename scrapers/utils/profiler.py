@@ -0,0 +1,294 @@
+"""
+Run Profiler - Per-source CPU and memory profiles of scraper runs
+Two modes, written as one report per run() to PROFILE_DIR:
+- full: cProfile (top functions) and tracemalloc (allocation sites).
+  Precise but slow. cProfile only sees the run's own thread (parse pool
+  processes and helper threads are missing), while tracemalloc traces
+  every thread: profiled runs are serialized so allocations are not
+  mixed between sources
+- sample: a background thread records the run thread's stack every
+  PROFILE_SAMPLE_INTERVAL seconds. Low overhead, safe in production;
+  also writes collapsed stacks for flamegraph.pl / speedscope
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config import PROFILE_MODE, PROFILE_DIR, PROFILE_SAMPLE_INTERVAL, PROFILE_TOP_N, PROFILE_KEEP
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "full", "sample")
+MAX_STACK_DEPTH = 64
+TRACEMALLOC_FRAMES = 10
+
+# (filename, first line, function name) - one function, whichever line is running
+FrameKey = Tuple[str, int, str]
+
+
+def peak_rss_mib() -> Optional[float]:
+    """
+    Process high-water RSS so far (None where unsupported)
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _frame_label(key: FrameKey) -> str:
+    filename, lineno, name = key
+    return f"{name} ({_short_path(filename)}:{lineno})"
+
+
+def _short_path(filename: str) -> str:
+    # site-packages/bs4/element.py rather than the full venv path
+    parts = Path(filename).parts
+    for marker in ("site-packages", "dist-packages"):
+        if marker in parts:
+            return "/".join(parts[parts.index(marker) + 1:])
+    return "/".join(parts[-2:])
+
+
+class StackSampler(threading.Thread):
+    """
+    Samples the stacks of registered threads at a fixed interval
+    Counts are kept per source until the source's run takes them
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.threads: Dict[int, str] = {}  # thread ident -> source
+        self.stacks: Dict[str, Counter] = {}
+
+    def register(self, source_name: str):
+        with self.lock:
+            self.threads[threading.get_ident()] = source_name
+            self.stacks[source_name] = Counter()
+
+    def take(self, source_name: str) -> Counter:
+        """
+        Stop sampling the calling thread and return its source's stacks
+        """
+        with self.lock:
+            self.threads.pop(threading.get_ident(), None)
+            return self.stacks.pop(source_name, Counter())
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+
+            with self.lock:
+                if not self.threads:
+                    continue
+                frames = sys._current_frames()
+
+                for ident, source_name in self.threads.items():
+                    frame = frames.get(ident)
+                    stack = []
+                    while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                        code = frame.f_code
+                        stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                        frame = frame.f_back
+                    if stack:
+                        self.stacks[source_name][tuple(reversed(stack))] += 1
+
+
+class RunProfiler:
+    """
+    Wraps scraper runs in the configured profiling mode
+    """
+
+    def __init__(
+        self,
+        mode: str = PROFILE_MODE,
+        reports_dir: Path = PROFILE_DIR,
+        sample_interval: float = PROFILE_SAMPLE_INTERVAL,
+        top_n: int = PROFILE_TOP_N,
+        keep: int = PROFILE_KEEP
+    ):
+        self.reports_dir = reports_dir
+        self.sample_interval = sample_interval
+        self.top_n = top_n
+        self.keep = keep
+
+        # tracemalloc traces every thread of the process (cProfile only the
+        # calling one): one full profile at a time
+        self.full_lock = threading.Lock()
+        self.sampler: Optional[StackSampler] = None
+        self.sampler_lock = threading.Lock()
+
+        self.configure(mode)
+
+    def configure(self, mode: str):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode {mode!r} (expected one of {', '.join(MODES)})")
+        self.mode = mode
+
+    @contextmanager
+    def profile(self, source_name: str):
+        """
+        Profile the block as one run of source_name and write its report
+        """
+        if self.mode == "full":
+            with self._full(source_name):
+                yield
+        elif self.mode == "sample":
+            with self._sampled(source_name):
+                yield
+        else:
+            yield
+
+    @contextmanager
+    def _full(self, source_name: str):
+        with self.full_lock:
+            profiler = cProfile.Profile()
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            start = time.perf_counter()
+
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                elapsed = time.perf_counter() - start
+                snapshot = tracemalloc.take_snapshot()
+                _, traced_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                self._write_full_report(source_name, elapsed, profiler, snapshot, traced_peak)
+
+    @contextmanager
+    def _sampled(self, source_name: str):
+        with self.sampler_lock:
+            if self.sampler is None:
+                self.sampler = StackSampler(self.sample_interval)
+                self.sampler.start()
+
+        self.sampler.register(source_name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stacks = self.sampler.take(source_name)
+            self._write_sample_report(source_name, elapsed, stacks)
+
+    def _report_path(self, source_name: str, suffix: str, stamp: str) -> Path:
+        slug = source_name.lower().replace(" ", "_").replace(".", "")
+        return self.reports_dir / f"{slug}_{stamp}{suffix}"
+
+    def _header(self, source_name: str, mode: str, elapsed: float) -> str:
+        rss = peak_rss_mib()
+        rss_text = f"{rss:.1f} MiB" if rss is not None else "n/a"
+        return (
+            f"Profile: {source_name} ({mode}) {datetime.now().isoformat(timespec='seconds')}\n"
+            f"Wall time: {elapsed:.2f}s   Peak RSS (process): {rss_text}\n"
+        )
+
+    def _write_full_report(self, source_name, elapsed, profiler, snapshot, traced_peak):
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report = io.StringIO()
+        report.write(self._header(source_name, "full", elapsed))
+        report.write(f"Traced allocation peak: {traced_peak / (1024 * 1024):.1f} MiB\n")
+
+        for sort_key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+            report.write(f"\nTop {self.top_n} functions by {title}\n")
+            stats = pstats.Stats(profiler, stream=report)
+            stats.strip_dirs().sort_stats(sort_key).print_stats(self.top_n)
+
+        report.write(f"\nTop {self.top_n} allocation sites (live at end of run)\n")
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")
+        ])
+        for index, stat in enumerate(snapshot.statistics("lineno")[:self.top_n], 1):
+            frame = stat.traceback[0]
+            report.write(
+                f"{index:3}. {_short_path(frame.filename)}:{frame.lineno}  "
+                f"{stat.size / 1024:.1f} KiB in {stat.count} blocks\n"
+            )
+
+        path = self._report_path(source_name, ".txt", stamp)
+        self._write(path, report.getvalue())
+        profiler.dump_stats(str(self._report_path(source_name, ".prof", stamp)))
+        self._prune(source_name)
+
+        logger.info(f"[OK] Profile for {source_name} written to {path} (cProfile data: .prof)")
+
+    def _write_sample_report(self, source_name: str, elapsed: float, stacks: Counter):
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        total = sum(stacks.values())
+
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in stacks.items():
+            own[stack[-1]] += count
+            for key in set(stack):
+                inclusive[key] += count
+
+        report = io.StringIO()
+        report.write(self._header(source_name, "sample", elapsed))
+        report.write(f"Samples: {total} every {self.sample_interval * 1000:.0f}ms (wall clock: sleeps and I/O waits included)\n")
+
+        for title, counts in (("inclusive", inclusive), ("own", own)):
+            report.write(f"\nTop {self.top_n} functions by {title} samples\n")
+            for key, count in counts.most_common(self.top_n):
+                share = count / total if total else 0.0
+                report.write(f"{share:7.1%} {count:7}  {_frame_label(key)}\n")
+
+        path = self._report_path(source_name, ".txt", stamp)
+        self._write(path, report.getvalue())
+        self._write(
+            self._report_path(source_name, ".collapsed", stamp),
+            "".join(
+                ";".join(f"{name} ({_short_path(filename)})" for filename, _, name in stack) + f" {count}\n"
+                for stack, count in stacks.most_common()
+            )
+        )
+        self._prune(source_name)
+
+        logger.info(f"[OK] Sampled profile for {source_name} written to {path} ({total} samples)")
+
+    def _write(self, path: Path, text: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def _prune(self, source_name: str):
+        """
+        Keep the newest `keep` reports per source (long daemon runs)
+        """
+        slug = self._report_path(source_name, "", "").name
+        reports = sorted(self.reports_dir.glob(f"{slug}*.txt"))
+
+        for old in reports[:-self.keep] if self.keep else []:
+            for sibling in old.parent.glob(f"{old.stem}.*"):
+                try:
+                    os.remove(sibling)
+                except OSError:
+                    pass
+
+
+# Global instance
+profiler = RunProfiler()
@@ -0,0 +1,255 @@
+"""
+Push Sink - Batched, gzip-compressed article push to the backend API
+Articles are POSTed to PUSH_ENDPOINT over a keep-alive session as they are
+extracted. Batches close on count, size or age; at most PUSH_MAX_IN_FLIGHT
+are sent at once, and a batch that can't be sent (window full, backend
+slow or down) is spilled to an on-disk queue and replayed later
+"""
+
+import gzip
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    PUSH_ENDPOINT, SCRAPER_API_KEY, USER_AGENT,
+    PUSH_BATCH_ARTICLES, PUSH_BATCH_BYTES, PUSH_BATCH_SECONDS,
+    PUSH_MAX_IN_FLIGHT, PUSH_TIMEOUT, PUSH_SPOOL_DIR
+)
+from utils.retry_policy import is_retryable_status
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DOWN_COOLDOWN = 30  # seconds new batches go straight to the spool after a failed POST
+WINDOW_WAIT = 1.0  # seconds a batch waits for a free in-flight slot before spilling
+
+
+class PushSink:
+    """
+    Thread-safe article sink shared by every scraper in the process
+    write() never waits on the network for more than WINDOW_WAIT: sending
+    happens on a small pool and sustained backpressure turns into spilled
+    batches, not slower scraping
+    """
+
+    def __init__(
+        self,
+        endpoint: str = PUSH_ENDPOINT,
+        api_key: str = SCRAPER_API_KEY,
+        batch_articles: int = PUSH_BATCH_ARTICLES,
+        batch_bytes: int = PUSH_BATCH_BYTES,
+        batch_seconds: float = PUSH_BATCH_SECONDS,
+        max_in_flight: int = PUSH_MAX_IN_FLIGHT,
+        timeout: float = PUSH_TIMEOUT,
+        spool_dir: Path = PUSH_SPOOL_DIR
+    ):
+        self.endpoint = endpoint
+        self.batch_articles = batch_articles
+        self.batch_bytes = batch_bytes
+        self.batch_seconds = batch_seconds
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.spool_dir = spool_dir
+
+        self.headers = {
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+            "User-Agent": USER_AGENT
+        }
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+
+        self.lock = threading.Lock()
+        self.replay_lock = threading.Lock()
+        self.window = threading.BoundedSemaphore(max_in_flight)
+        self.session: Optional[requests.Session] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+        self.batch: List[bytes] = []
+        self.batch_size = 0
+        self.batch_started = 0.0
+        self.down_until = 0.0
+        self.spool_counter = 0
+
+        self.sent = 0
+        self.spilled = 0
+
+    def _ensure_session(self):
+        if self.session is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_in_flight)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+    def _ensure_started(self):
+        # Called with self.lock held
+        self._ensure_session()
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="push")
+
+    def _take_batch(self) -> Optional[bytes]:
+        # Called with self.lock held
+        if not self.batch:
+            return None
+
+        body = b'{"articles":[' + b",".join(self.batch) + b"]}"
+        self.batch = []
+        self.batch_size = 0
+        return body
+
+    def write(self, article):
+        """
+        Queue one article; sends a batch once it is full or old enough
+        """
+        data = article.to_json().encode("utf-8")
+        ready = []
+
+        with self.lock:
+            self._ensure_started()
+
+            if self.batch and self.batch_size + len(data) > self.batch_bytes:
+                ready.append(self._take_batch())
+
+            if not self.batch:
+                self.batch_started = time.monotonic()
+            self.batch.append(data)
+            self.batch_size += len(data) + 1
+
+            if (
+                len(self.batch) >= self.batch_articles
+                or time.monotonic() - self.batch_started >= self.batch_seconds
+            ):
+                ready.append(self._take_batch())
+
+        for body in ready:
+            self._submit(body)
+
+    def flush(self):
+        """
+        Send whatever is batched now (end of a scraper run)
+        """
+        with self.lock:
+            body = self._take_batch()
+
+        if body:
+            self._submit(body)
+
+    def _submit(self, body: bytes):
+        payload = gzip.compress(body, compresslevel=5)
+
+        if time.monotonic() < self.down_until or not self.window.acquire(timeout=WINDOW_WAIT):
+            self._spool(payload)
+            return
+
+        self.executor.submit(self._send_in_window, payload)
+
+    def _send_in_window(self, payload: bytes):
+        try:
+            if self._deliver(payload):
+                self._replay()
+            else:
+                self._spool(payload)
+        finally:
+            self.window.release()
+
+    def _deliver(self, payload: bytes) -> bool:
+        """
+        POST one batch; False means keep it for later
+        Non-retryable rejections are logged and dropped
+        """
+        try:
+            response = self.session.post(self.endpoint, data=payload, headers=self.headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.warning(f"Push to {self.endpoint} failed: {e}")
+            self.down_until = time.monotonic() + BACKEND_DOWN_COOLDOWN
+            return False
+
+        # The backend answers 200 only once every article is stored
+        if response.ok:
+            self.sent += 1
+            return True
+
+        if is_retryable_status(response.status_code):
+            logger.warning(f"Backend busy ({response.status_code}), spooling batches for {BACKEND_DOWN_COOLDOWN}s")
+            self.down_until = time.monotonic() + BACKEND_DOWN_COOLDOWN
+            return False
+
+        logger.error(f"Backend rejected a batch ({response.status_code}), dropping it: {response.text[:200]}")
+        return True
+
+    def _spool(self, payload: bytes):
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+
+        with self.lock:
+            self.spool_counter += 1
+            name = f"{time.time_ns()}_{os.getpid()}_{self.spool_counter:06d}.json.gz"
+
+        # Write-then-rename so the replayer never reads a partial batch
+        tmp_path = self.spool_dir / f"{name}.tmp"
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(self.spool_dir / name)
+
+        self.spilled += 1
+        logger.info(f"Spooled a batch to {self.spool_dir / name}")
+
+    def pending(self) -> List[Path]:
+        return sorted(self.spool_dir.glob("*.json.gz"))
+
+    def _replay(self):
+        """
+        Send spooled batches oldest first, stopping at the first failure
+        Only one thread replays at a time
+        """
+        if not self.replay_lock.acquire(blocking=False):
+            return
+
+        try:
+            for path in self.pending():
+                if time.monotonic() < self.down_until:
+                    break
+                try:
+                    payload = path.read_bytes()
+                except FileNotFoundError:
+                    continue  # replayed by another process
+
+                if not self._deliver(payload):
+                    break
+                path.unlink(missing_ok=True)
+                logger.info(f"[OK] Replayed spooled batch {path.name}")
+        finally:
+            self.replay_lock.release()
+
+    def close(self):
+        """
+        Send the last batch, wait for in-flight POSTs and try the spool once more
+        """
+        self.flush()
+
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor:
+            executor.shutdown(wait=True)
+
+        waiting = self.pending() if self.spool_dir.exists() else []
+        if waiting:
+            with self.lock:
+                self._ensure_session()
+            self._replay()
+            waiting = self.pending()
+
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+        logger.info(f"[OK] Pushed {self.sent} batches, spooled {self.spilled}, {len(waiting)} waiting for replay")
+
+
+# Global instance
+push_sink = PushSink()
@@ -0,0 +1,81 @@
+"""
+Rate Limiter - Per-domain token buckets shared across processes
+Bucket state lives in SQLite, so every scraper process on this machine
+draws from the same budget for a domain
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+from config import RATE_LIMIT_DB, RATE_LIMIT_BURST
+from utils.local_db import LazyDb
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketLimiter(LazyDb):
+    """
+    Token bucket per domain: one token per request, refilled at one token
+    every `interval` seconds, holding at most `capacity` tokens.
+    Reservations may overdraw the bucket; the debt is the caller's wait,
+    so concurrent callers are spaced out instead of all waking together.
+    """
+
+    def __init__(self, db_path: Path = RATE_LIMIT_DB, capacity: int = RATE_LIMIT_BURST):
+        self.capacity = max(1, capacity)
+        super().__init__(db_path)
+        self.lock = threading.Lock()
+
+    def _setup(self, conn):
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_buckets (
+                    domain TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    def reserve(self, domain: str, interval: float) -> float:
+        """
+        Take one token for the domain
+        Returns how many seconds the caller must wait before sending
+        """
+        with self.lock:
+            # BEGIN IMMEDIATE takes SQLite's write lock, serializing
+            # reservations across processes as well as threads
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self.conn.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE domain = ?", (domain,)
+                ).fetchone()
+
+                if row is None:
+                    tokens = float(self.capacity)
+                else:
+                    tokens, updated_at = row
+                    if interval > 0:
+                        tokens += (now - updated_at) / interval
+                    else:
+                        tokens = float(self.capacity)
+                    tokens = min(float(self.capacity), tokens)
+
+                tokens -= 1
+
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO token_buckets (domain, tokens, updated_at) VALUES (?, ?, ?)",
+                    (domain, tokens, now)
+                )
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+        return -tokens * interval if tokens < 0 else 0.0
+
+
+# Global instance
+rate_limiter = TokenBucketLimiter()
@@ -0,0 +1,168 @@
+"""
+Retry Policy - Backoff, Retry-After handling and per-domain circuit breaker
+Keeps a struggling or dead outlet from stalling a whole run
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from config import (
+    MAX_RETRIES, RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX, RETRY_AFTER_MAX,
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying; other 4xx responses will not change on retry
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def is_retryable_status(status: int) -> bool:
+    """
+    Check if an HTTP error status may succeed on a later attempt
+    """
+    return status in RETRYABLE_STATUSES
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds to wait before retry number `attempt` (0-based)
+    Honours the server's Retry-After, otherwise uses exponential backoff
+    with full jitter. None when the server asks for more than
+    RETRY_AFTER_MAX: retrying sooner than asked would only be refused again
+    """
+    if retry_after is not None:
+        return retry_after if retry_after <= RETRY_AFTER_MAX else None
+
+    ceiling = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Per-domain circuit breaker
+    After `threshold` consecutive failures the domain is skipped for
+    `cooldown` seconds; then a single probe request is let through, which
+    closes the circuit on success or re-opens it on failure
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_FAILURE_THRESHOLD, cooldown: float = CIRCUIT_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures: Dict[str, int] = {}
+        self.opened_at: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def _domain(self, url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def is_open(self, url: str) -> bool:
+        """
+        Check if requests to the URL's domain are currently being refused
+        """
+        domain = self._domain(url)
+
+        with self.lock:
+            if self.failures.get(domain, 0) < self.threshold:
+                return False
+            return time.time() - self.opened_at.get(domain, 0) < self.cooldown
+
+    def allow(self, url: str) -> bool:
+        """
+        Check if a request may be sent; claims the probe slot after cooldown
+        """
+        domain = self._domain(url)
+
+        with self.lock:
+            if self.failures.get(domain, 0) < self.threshold:
+                return True
+
+            if time.time() - self.opened_at.get(domain, 0) < self.cooldown:
+                return False
+
+            # Half-open: let this request probe, hold everyone else back
+            self.opened_at[domain] = time.time()
+            logger.info(f"Circuit half-open for {domain}, probing")
+            return True
+
+    def record_success(self, url: str):
+        domain = self._domain(url)
+
+        with self.lock:
+            if self.failures.get(domain, 0) >= self.threshold:
+                logger.info(f"[OK] Circuit closed for {domain}")
+            self.failures[domain] = 0
+
+    def record_failure(self, url: str):
+        domain = self._domain(url)
+
+        with self.lock:
+            self.failures[domain] = self.failures.get(domain, 0) + 1
+
+            if self.failures[domain] >= self.threshold:
+                self.opened_at[domain] = time.time()
+                if self.failures[domain] == self.threshold:
+                    logger.warning(
+                        f"Circuit open for {domain} after {self.threshold} consecutive failures, "
+                        f"cooling down {self.cooldown:.0f}s"
+                    )
+
+
+# Global instance
+circuit_breaker = CircuitBreaker()
+
+
+def next_retry_delay(
+    url: str,
+    attempt: int,
+    status: Optional[int] = None,
+    retry_after: Optional[str] = None
+) -> Optional[float]:
+    """
+    Record a failed attempt and decide whether to try again
+    status is the HTTP error status (None for network errors), retry_after
+    the raw Retry-After header. Returns seconds to wait, or None to give up
+    """
+    if status is not None and not is_retryable_status(status):
+        # The domain answered; this URL just won't work
+        return None
+
+    circuit_breaker.record_failure(url)
+
+    if attempt >= MAX_RETRIES - 1 or circuit_breaker.is_open(url):
+        return None
+
+    wait = parse_retry_after(retry_after)
+    delay = backoff_delay(attempt, wait)
+    if delay is None:
+        logger.warning(f"Giving up on {url}: Retry-After {wait:.0f}s is over the {RETRY_AFTER_MAX:.0f}s limit")
+    return delay
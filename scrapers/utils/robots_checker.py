@@ -3,40 +3,104 @@ Robots.txt Checker - Ensures Respectful Scraping
 Espectro respects robots.txt and implements crawl delays
 """
 
+import asyncio
+import threading
 import time
+from pathlib import Path
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
 import requests
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import logging
 
-from config import USER_AGENT, ROBOTS_CACHE, CRAWL_DELAY
+from config import (
+    USER_AGENT, ROBOTS_CACHE, CRAWL_DELAY,
+    ROBOTS_CACHE_DB, ROBOTS_CACHE_TTL, ROBOTS_FAILURE_TTL
+)
+from utils.local_db import LazyDb
+from utils.metrics import metrics
+from utils.rate_limiter import rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Stand-in robots.txt while the real one is unavailable (5xx or 429)
+DISALLOW_ALL = "User-agent: *\nDisallow: /\n"
 
-class RobotsChecker:
+
+class RobotsChecker(LazyDb):
     """
     Checks robots.txt compliance and enforces crawl delays
     Critical for ethical scraping and avoiding IP bans
     """
 
-    def __init__(self):
-        self.cache: Dict[str, RobotFileParser] = ROBOTS_CACHE
-        self.last_request_time: Dict[str, float] = {}
-
-    def get_robots_parser(self, url: str) -> Optional[RobotFileParser]:
+    def __init__(
+        self,
+        db_path: Path = ROBOTS_CACHE_DB,
+        ttl: float = ROBOTS_CACHE_TTL,
+        failure_ttl: float = ROBOTS_FAILURE_TTL
+    ):
+        # domain -> (parser or None for a failed fetch, expires_at)
+        self.cache: Dict[str, Tuple[Optional[RobotFileParser], float]] = ROBOTS_CACHE
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        super().__init__(db_path)
+        self._db_lock = threading.Lock()
+        # One lock per domain so concurrent threads fetch robots.txt once
+        self._domain_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _setup(self, conn):
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS robots_cache (
+                    domain TEXT PRIMARY KEY,
+                    body TEXT,
+                    expires_at REAL NOT NULL
+                )
+            """)
+
+    def _domain_lock(self, domain: str) -> threading.Lock:
         """
-        Fetch and parse robots.txt for a given domain
+        Get (or create) the lock for a domain
         """
-        parsed = urlparse(url)
-        domain = f"{parsed.scheme}://{parsed.netloc}"
+        with self._locks_guard:
+            if domain not in self._domain_locks:
+                self._domain_locks[domain] = threading.Lock()
+            return self._domain_locks[domain]
 
-        # Check cache first
-        if domain in self.cache:
-            return self.cache[domain]
+    def _build_parser(self, body: Optional[str]) -> Optional[RobotFileParser]:
+        if body is None:
+            return None
+
+        parser = RobotFileParser()
+        parser.parse(body.splitlines())
+        return parser
+
+    def _load_stored(self, domain: str) -> Optional[Tuple[Optional[str], float]]:
+        """
+        Read an unexpired robots.txt entry persisted by any process
+        """
+        with self._db_lock:
+            row = self.conn.execute(
+                "SELECT body, expires_at FROM robots_cache WHERE domain = ? AND expires_at > ?",
+                (domain, time.time())
+            ).fetchone()
+
+        return row
+
+    def _store(self, domain: str, body: Optional[str], expires_at: float):
+        with self._db_lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO robots_cache (domain, body, expires_at) VALUES (?, ?, ?)",
+                (domain, body, expires_at)
+            )
 
-        # Fetch robots.txt
+    def _fetch_robots(self, domain: str) -> Tuple[Optional[str], float]:
+        """
+        Download robots.txt; returns its body and how long to cache it
+        A missing one (4xx) allows everything; an unavailable one (5xx,
+        429) disallows everything for failure_ttl; None means the fetch failed
+        """
         robots_url = urljoin(domain, "/robots.txt")
 
         try:
@@ -47,29 +111,67 @@ class RobotsChecker:
                 timeout=5
             )
 
-            if response.status_code == 200:
-                parser = RobotFileParser()
-                parser.parse(response.text.splitlines())
-                self.cache[domain] = parser
-                logger.info(f"[OK] Successfully parsed robots.txt for {domain}")
-                return parser
-            else:
-                logger.warning(f"No robots.txt found at {robots_url} (Status: {response.status_code})")
+            status = response.status_code
+
+            if status == 429 or status >= 500:
+                logger.warning(
+                    f"robots.txt unavailable at {robots_url} (Status: {status}), "
+                    f"treating {domain} as disallowed for {self.failure_ttl:.0f}s"
+                )
+                return DISALLOW_ALL, self.failure_ttl
+
+            if status >= 400:
+                logger.warning(f"No robots.txt found at {robots_url} (Status: {status})")
                 # If no robots.txt, assume everything is allowed
-                parser = RobotFileParser()
-                parser.parse([])
-                self.cache[domain] = parser
-                return parser
+                return "", self.ttl
+
+            logger.info(f"[OK] Successfully parsed robots.txt for {domain}")
+            return response.text, self.ttl
 
         except Exception as e:
             logger.error(f"Error fetching robots.txt from {robots_url}: {e}")
-            return None
+            return None, self.failure_ttl
+
+    def get_robots_parser(self, url: str) -> Optional[RobotFileParser]:
+        """
+        Fetch and parse robots.txt for a given domain
+        Served from memory, then the shared on-disk cache, then the network.
+        Failed fetches are cached too (for failure_ttl) and return None;
+        a server error or 429 is cached as disallow-all for failure_ttl.
+        """
+        parsed = urlparse(url)
+        domain = f"{parsed.scheme}://{parsed.netloc}"
+
+        # Check in-memory cache first
+        entry = self.cache.get(domain)
+        if entry and entry[1] > time.time():
+            return entry[0]
+
+        with self._domain_lock(domain):
+            # Another thread may have refreshed it while we waited
+            entry = self.cache.get(domain)
+            if entry and entry[1] > time.time():
+                return entry[0]
+
+            stored = self._load_stored(domain)
+
+            if stored is not None:
+                body, expires_at = stored
+            else:
+                body, ttl = self._fetch_robots(domain)
+                expires_at = time.time() + ttl
+                self._store(domain, body, expires_at)
+
+            parser = self._build_parser(body)
+            self.cache[domain] = (parser, expires_at)
+            return parser
 
     def can_fetch(self, url: str) -> bool:
         """
         Check if URL can be scraped according to robots.txt
         """
-        parser = self.get_robots_parser(url)
+        with metrics.stage("robots"):
+            parser = self.get_robots_parser(url)
 
         if parser is None:
             # If we can't fetch robots.txt, err on the side of caution
@@ -102,24 +204,30 @@ class RobotsChecker:
 
         return CRAWL_DELAY
 
-    def enforce_rate_limit(self, url: str):
+    def reserve_request_slot(self, url: str) -> float:
         """
-        Enforce crawl delay between requests to the same domain
+        Book the next free request slot for the URL's domain
+        Uses the shared token bucket, refilled once per crawl delay, so the
+        budget holds across every scraper process on this machine.
+        Returns how many seconds the caller must wait before sending
         """
         parsed = urlparse(url)
         domain = f"{parsed.scheme}://{parsed.netloc}"
 
         crawl_delay = self.get_crawl_delay(url)
 
-        if domain in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[domain]
+        return rate_limiter.reserve(domain, crawl_delay)
 
-            if elapsed < crawl_delay:
-                sleep_time = crawl_delay - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+    def enforce_rate_limit(self, url: str):
+        """
+        Enforce crawl delay between requests to the same domain
+        """
+        sleep_time = self.reserve_request_slot(url)
 
-        self.last_request_time[domain] = time.time()
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+            time.sleep(sleep_time)
+            metrics.add_time("rate_limit", sleep_time)
 
 
 # Global instance
@@ -138,3 +246,15 @@ def wait_for_rate_limit(url: str):
     Convenience function to enforce rate limiting
     """
     robots_checker.enforce_rate_limit(url)
+
+
+async def wait_for_rate_limit_async(url: str):
+    """
+    Async variant of wait_for_rate_limit - yields to the event loop while waiting
+    """
+    sleep_time = await asyncio.to_thread(robots_checker.reserve_request_slot, url)
+
+    if sleep_time > 0:
+        logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+        await asyncio.sleep(sleep_time)
+        metrics.add_time("rate_limit", sleep_time)
@@ -0,0 +1,87 @@
+"""
+Scheduler - Long-running per-source polling for daemon mode
+Each source polls on its own thread and interval; the interval shrinks
+while the source keeps publishing and stretches while it is quiet
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+from config import DAEMON_MIN_INTERVAL, DAEMON_MAX_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveInterval:
+    """
+    Poll interval that follows how often a source actually changes
+    Halves after a poll that found new articles, grows 1.5x after one that
+    didn't, always within [minimum, maximum]
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        minimum: float = DAEMON_MIN_INTERVAL,
+        maximum: float = DAEMON_MAX_INTERVAL,
+        speedup: float = 0.5,
+        slowdown: float = 1.5
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.speedup = speedup
+        self.slowdown = slowdown
+        self.current = min(maximum, max(minimum, initial))
+
+    def update(self, changed: bool) -> float:
+        factor = self.speedup if changed else self.slowdown
+        self.current = min(self.maximum, max(self.minimum, self.current * factor))
+        return self.current
+
+
+class SourceLoop(threading.Thread):
+    """
+    Runs one source's poll function until stop_event is set
+    A poll in progress is always allowed to finish (and write its output)
+    before the loop exits; on_exit then runs on the loop's own thread,
+    however the loop ended
+    """
+
+    def __init__(
+        self,
+        name: str,
+        poll: Callable[[], int],
+        interval: AdaptiveInterval,
+        stop_event: threading.Event,
+        on_exit: Optional[Callable[[], None]] = None
+    ):
+        super().__init__(name=f"poll-{name}", daemon=True)
+        self.source = name
+        self.poll = poll
+        self.interval = interval
+        self.stop_event = stop_event
+        self.on_exit = on_exit
+
+    def run(self):
+        try:
+            self._poll_until_stopped()
+        finally:
+            if self.on_exit is not None:
+                self.on_exit()
+
+    def _poll_until_stopped(self):
+        while not self.stop_event.is_set():
+            try:
+                new_articles = self.poll()
+            except Exception as e:
+                logger.error(f"✗ Poll failed for {self.source}: {e}", exc_info=True)
+                new_articles = 0
+
+            wait = self.interval.update(new_articles > 0)
+            logger.info(f"{self.source}: {new_articles} new articles, next poll in {wait:.0f}s")
+
+            # Interruptible sleep: returns early on shutdown
+            self.stop_event.wait(wait)
+
+        logger.info(f"[OK] {self.source} poller stopped")
@@ -0,0 +1,136 @@
+"""
+Seen-URL Index - Incremental crawl state across runs
+A SQLite table records when each article URL was first and last seen
+(plus a hash of its headline content); an in-memory Bloom filter answers
+"never seen" without touching the database
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from config import SEEN_INDEX_DB, SEEN_BLOOM_CAPACITY, SEEN_BLOOM_ERROR_RATE
+from utils.local_db import LazyDb
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings
+    No false negatives; false positives at roughly error_rate once
+    `capacity` items have been added
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+def content_hash(article) -> str:
+    """
+    Hash of the fields that make an article "changed" between runs
+    """
+    payload = f"{article.title}\x1f{article.snippet}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class SeenUrlIndex(LazyDb):
+    """
+    Persistent record of article URLs already emitted
+    """
+
+    def __init__(
+        self,
+        db_path: Path = SEEN_INDEX_DB,
+        capacity: int = SEEN_BLOOM_CAPACITY,
+        error_rate: float = SEEN_BLOOM_ERROR_RATE
+    ):
+        super().__init__(db_path)
+        self.lock = threading.Lock()
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bloom: Optional[BloomFilter] = None  # filled from the table on first use
+
+    def _setup(self, conn):
+        bloom = BloomFilter(self.capacity, self.error_rate)
+
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_urls (
+                    url TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    first_seen REAL NOT NULL,
+                    last_seen REAL NOT NULL
+                )
+            """)
+
+            for (url,) in conn.execute("SELECT url FROM seen_urls"):
+                bloom.add(url)
+
+        self.bloom = bloom
+
+    def is_unseen(self, article) -> bool:
+        """
+        True if the article is new, or its title/snippet changed
+        Nothing is recorded until record() is called
+        """
+        with self.lock:
+            return self._is_unseen(article)
+
+    def _is_unseen(self, article) -> bool:
+        # Called with self.lock held
+        conn = self.conn  # opens the index and loads the Bloom filter once
+        if article.url not in self.bloom:
+            return True
+
+        row = conn.execute(
+            "SELECT content_hash FROM seen_urls WHERE url = ?", (article.url,)
+        ).fetchone()
+
+        return row is None or row[0] != content_hash(article)
+
+    def record(self, snapshot: List[Tuple[str, str]]):
+        """
+        Mark (url, content_hash) pairs as seen now (first_seen is kept for known URLs)
+        """
+        now = time.time()
+        rows = [(url, digest, now, now) for url, digest in snapshot]
+
+        with self.lock, self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO seen_urls (url, content_hash, first_seen, last_seen)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    last_seen = excluded.last_seen
+                """,
+                rows
+            )
+
+            for url, _ in snapshot:
+                self.bloom.add(url)
+
+
+# Global instance
+seen_index = SeenUrlIndex()
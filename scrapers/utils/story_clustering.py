@@ -0,0 +1,263 @@
+"""
+Story Clustering - MinHash LSH over normalized headlines
+Assigns each article the cluster_key of the story it covers, across sources
+and recent runs. Each article is hashed once and only compared with the
+few articles that share an LSH bucket, so cost grows linearly with volume
+(the backend's ClusteringService compares every pair with Levenshtein)
+"""
+
+import hashlib
+import logging
+import random
+import re
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from config import (
+    CLUSTER_DB, CLUSTER_SIMILARITY, CLUSTER_WINDOW_HOURS, CLUSTER_NUM_PERM, CLUSTER_BANDS
+)
+from utils.local_db import LazyDb
+
+logger = logging.getLogger(__name__)
+
+# Same list as normalizeHeadline in backend/src/services/clusteringService.ts
+STOP_WORDS = {
+    "o", "a", "os", "as", "um", "uma", "de", "do", "da", "dos", "das",
+    "em", "no", "na", "nos", "nas", "para", "por", "com", "sem",
+    "e", "ou", "mas", "que", "como", "quando", "onde"
+}
+
+# JS /[^\w\s]/g: \w is ASCII-only there, so accented letters are removed too
+PUNCTUATION_PATTERN = re.compile(r"[^A-Za-z0-9_\s]")
+
+MERSENNE_PRIME = (1 << 61) - 1
+MIN_SHINGLES = 3  # shorter headlines get a cluster of their own
+
+
+def normalize_headline(headline: str) -> str:
+    """
+    Python port of the backend's normalizeHeadline, so clusters built here
+    agree with the ones it builds
+    """
+    normalized = PUNCTUATION_PATTERN.sub("", headline)
+    words = normalized.lower().split()
+    return " ".join(word for word in words if word not in STOP_WORDS and len(word) > 2)
+
+
+def shingles(headline: str) -> Set[str]:
+    """
+    Word shingles of the normalized headline (the backend's keyword sets)
+    """
+    return set(normalize_headline(headline).split())
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class MinHasher:
+    """
+    MinHash signatures from num_perm universal hash functions
+    (a * x + b) mod p; seeded, so signatures are stable across runs
+    """
+
+    def __init__(self, num_perm: int = CLUSTER_NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, items: Set[str]) -> array:
+        hashes = [_shingle_hash(item) for item in items]
+        return array("Q", (
+            min((a * h + b) % MERSENNE_PRIME for h in hashes)
+            for a, b in self.params
+        ))
+
+
+def estimated_jaccard(sig1: array, sig2: array) -> float:
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class StoryClusterer(LazyDb):
+    """
+    Persistent LSH index of recent headlines
+    An article joins the cluster of its most similar recent article (estimated
+    Jaccard >= similarity, candidates from shared LSH buckets); otherwise it
+    starts a new cluster keyed by its own URL. Articles still in a pipeline
+    are held in memory until they are written (record) or dropped (release)
+    """
+
+    def __init__(
+        self,
+        db_path: Path = CLUSTER_DB,
+        similarity: float = CLUSTER_SIMILARITY,
+        window_hours: int = CLUSTER_WINDOW_HOURS,
+        num_perm: int = CLUSTER_NUM_PERM,
+        bands: int = CLUSTER_BANDS
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+
+        super().__init__(db_path)
+        self.lock = threading.Lock()
+        self.similarity = similarity
+        self.window = window_hours * 3600
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        # url -> (cluster_key, signature, buckets)
+        self.pending: Dict[str, Tuple[str, array, List[int]]] = {}
+
+    def _setup(self, conn):
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cluster_members (
+                    url TEXT PRIMARY KEY,
+                    cluster_key TEXT NOT NULL,
+                    signature BLOB NOT NULL,
+                    seen_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS lsh_buckets (
+                    bucket INTEGER NOT NULL,
+                    url TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_lsh_buckets ON lsh_buckets (bucket)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_lsh_buckets_url ON lsh_buckets (url)")
+            self._expire(conn, time.time())
+
+    def _expire(self, conn, now: float):
+        cutoff = now - self.window
+        conn.execute(
+            "DELETE FROM lsh_buckets WHERE url IN (SELECT url FROM cluster_members WHERE seen_at < ?)",
+            (cutoff,)
+        )
+        conn.execute("DELETE FROM cluster_members WHERE seen_at < ?", (cutoff,))
+
+    def _buckets(self, signature: array) -> List[int]:
+        """
+        One bucket id per band: hash of the band index and its rows,
+        as a signed 64-bit integer for SQLite
+        """
+        buckets = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(band.to_bytes(2, "little") + rows.tobytes(), digest_size=8).digest()
+            buckets.append(int.from_bytes(digest, "little", signed=True))
+        return buckets
+
+    def _best_match(self, url: str, signature: array, buckets: List[int], since: float) -> Optional[str]:
+        placeholders = ", ".join("?" for _ in buckets)
+        rows = self.conn.execute(
+            f"""
+            SELECT m.url, m.cluster_key, m.signature FROM cluster_members m
+            WHERE m.seen_at >= ? AND m.url != ? AND m.url IN (
+                SELECT url FROM lsh_buckets WHERE bucket IN ({placeholders})
+            )
+            """,
+            (since, url, *buckets)
+        ).fetchall()
+
+        candidates = []
+        for _, cluster_key, blob in rows:
+            other = array("Q")
+            other.frombytes(blob)
+            candidates.append((cluster_key, other))
+
+        # Held articles sharing a bucket
+        wanted = set(buckets)
+        for other_url, (cluster_key, other, other_buckets) in self.pending.items():
+            if other_url != url and not wanted.isdisjoint(other_buckets):
+                candidates.append((cluster_key, other))
+
+        best_key, best_score = None, self.similarity
+        for cluster_key, other in candidates:
+            score = estimated_jaccard(signature, other)
+            if score >= best_score:
+                best_key, best_score = cluster_key, score
+
+        return best_key
+
+    def assign(self, article) -> str:
+        """
+        Set article.cluster_key and return it; the article is held until
+        record() or release()
+        """
+        now = time.time()
+
+        with self.lock:
+            key = self.conn.execute(
+                "SELECT cluster_key FROM cluster_members WHERE url = ?", (article.url,)
+            ).fetchone()
+            key = key[0] if key else None
+
+            items = shingles(article.title)
+            if len(items) < MIN_SHINGLES:
+                article.cluster_key = key or self.new_key(article.url)
+                return article.cluster_key
+
+            signature = self.hasher.signature(items)
+            buckets = self._buckets(signature)
+
+            if key is None:
+                key = self._best_match(article.url, signature, buckets, now - self.window) or self.new_key(article.url)
+
+            article.cluster_key = key
+
+            # Held right away so later articles (any source) can join
+            self.pending[article.url] = (key, signature, buckets)
+            return key
+
+    def record(self, urls: Iterable[str]):
+        """
+        Store the held memberships of articles that were written
+        """
+        now = time.time()
+
+        with self.lock, self.conn:
+            for url in urls:
+                entry = self.pending.pop(url, None)
+                if entry is None:
+                    continue
+                key, signature, buckets = entry
+
+                self.conn.execute(
+                    """
+                    INSERT INTO cluster_members (url, cluster_key, signature, seen_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        signature = excluded.signature,
+                        seen_at = excluded.seen_at
+                    """,
+                    (url, key, signature.tobytes(), now)
+                )
+                self.conn.execute("DELETE FROM lsh_buckets WHERE url = ?", (url,))
+                self.conn.executemany(
+                    "INSERT INTO lsh_buckets (bucket, url) VALUES (?, ?)",
+                    [(bucket, url) for bucket in buckets]
+                )
+
+    def release(self, urls: Iterable[str]):
+        """
+        Forget the held memberships of articles that were never written
+        """
+        with self.lock:
+            for url in urls:
+                self.pending.pop(url, None)
+
+    @staticmethod
+    def new_key(url: str) -> str:
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# Global instance
+story_clusterer = StoryClusterer()
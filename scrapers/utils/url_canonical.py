@@ -0,0 +1,52 @@
+"""
+URL Canonicalization - One URL per story
+Folds host aliases (www/www1 Folha), tracking query params and fragments
+so the same article is never seen as several URLs
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config import CANONICAL_HOST_ALIASES, TRACKING_PARAM_PREFIXES, TRACKING_PARAMS
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL
+    - https for http(s) URLs on default ports, lowercase host, default port dropped
+    - host aliases from config.CANONICAL_HOST_ALIASES folded
+    - tracking params removed, remaining params sorted
+    - fragment removed
+    Non-http(s) or unparseable URLs are returned unchanged
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip(".")
+    host = CANONICAL_HOST_ALIASES.get(host, host)
+    if port and port != DEFAULT_PORTS[scheme]:
+        # Explicit ports (local mirrors, test servers) keep their scheme
+        host = f"{host}:{port}"
+    else:
+        scheme = "https"
+
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(name)
+    ))
+
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))